@@ -1,8 +1,7 @@
 from frontend.chapters.achievements_interface import AchievementsInterface
 
 from backend.modules.basic_window_of_functionality import BasicWindowFunctionality
-
-import csv
+from backend.modules.achievements_store import get_achievements_store
 
 from PyQt6.QtWidgets import QMainWindow
 
@@ -29,6 +28,18 @@ class Achievements(AchievementsInterface, BasicWindowFunctionality):
         self.load_achievements()
 
     
+    def reset_chapter(self) -> None:
+        """
+        Перед повторным открытием раздела снимает отметки с чекбоксов
+        и заново проверяет достижения (они могли измениться за игру)
+        """
+        for checkbox in [self.count_wins_checkbox,
+                         self.complete_all_levels_checkbox,
+                         self.count_marked_mines_checkbox]:
+            checkbox.setChecked(False)
+        self.load_achievements()
+
+
     def load_achievements(self) -> None:
         """
         Метод-координатор процесса загрузки достижений. Получает данные
@@ -41,11 +52,9 @@ class Achievements(AchievementsInterface, BasicWindowFunctionality):
     def load_achievements_data(self) -> dict:
         """
         Является вспомогательным для метода load_achievements. Осуществляет
-        загрузку данных
+        загрузку данных из общего хранилища достижений (файл читается один раз)
         """
-        with open(self.config.backend.data.achievements, 'r', encoding='utf8') as csv_file:
-            data = {row[0]: row[1] for row in csv.reader(csv_file, delimiter=';')}
-            return data
+        return get_achievements_store(self.config.backend.data.achievements).values()
 
 
     def get_achievements_config(self) -> dict:
@@ -0,0 +1,108 @@
+import atexit
+import csv
+import os
+import tempfile
+import threading
+
+
+class AchievementsStore:
+    """
+    Реализует хранение достижений игрока. Файл achievements.csv читается один
+    раз, после чего счетчики живут в памяти: изменения выполняются под блокировкой
+    и лишь помечают хранилище измененным. На диск достижения записываются методом
+    flush (в конце игры и при выходе) через временный файл, который атомарно
+    заменяет старый, поэтому сбой во время записи не может испортить файл
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.counters = self.read()  # в формате: {"Название достижения": значение}
+        self.dirty = False  # есть ли изменения, не записанные на диск
+
+
+    def read(self) -> dict[str, int]:
+        """
+        Читает достижения из файла
+        """
+        with open(self.path, "r", encoding="utf8") as csvfile:
+            return {row[0]: int(row[1]) for row in csv.reader(csvfile, delimiter=";", quotechar='"') if row}
+
+
+    def values(self) -> dict[str, str]:
+        """
+        Возвращает достижения в том же виде, в котором они хранятся в файле:
+        {"Название достижения": "значение"}
+        """
+        with self.lock:
+            return {name: str(value) for name, value in self.counters.items()}
+
+
+    def get(self, name: str) -> int:
+        """
+        Возвращает значение достижения
+        """
+        with self.lock:
+            return self.counters.get(name, 0)
+
+
+    def increment(self, name: str, amount: int = 1) -> int:
+        """
+        Увеличивает значение достижения и возвращает новое значение
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+            self.dirty = True
+            return self.counters[name]
+
+
+    def set(self, name: str, value: int) -> None:
+        """
+        Устанавливает значение достижения
+        """
+        with self.lock:
+            if self.counters.get(name) != value:
+                self.counters[name] = value
+                self.dirty = True
+
+
+    def flush(self) -> None:
+        """
+        Записывает измененные достижения на диск: сначала во временный файл
+        рядом с achievements.csv, затем атомарно подменяет им старый файл
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w", newline="", encoding="utf8") as csvfile:
+                    writer = csv.writer(
+                        csvfile, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL
+                    )
+                    writer.writerows([name, value] for name, value in self.counters.items())
+                    csvfile.flush()
+                    os.fsync(csvfile.fileno())  # данные должны оказаться на диске до подмены файла
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            self.dirty = False
+
+
+# открытые хранилища в формате: {путь_до_файла: AchievementsStore}
+achievements_stores = {}
+
+
+def get_achievements_store(path: str) -> AchievementsStore:
+    """
+    Возвращает общее для всей игры хранилище достижений для указанного файла.
+    Несохраненные изменения записываются при выходе из игры
+    """
+    if path not in achievements_stores:
+        achievements_stores[path] = AchievementsStore(path)
+        atexit.register(achievements_stores[path].flush)
+    return achievements_stores[path]
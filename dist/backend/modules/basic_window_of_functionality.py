@@ -23,7 +23,16 @@ class BasicWindowFunctionality:
         frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
 
         self.menu_chapter.open_window(frame_x, frame_y) # открываем меню игры в прежних координатах
-        self.close()    # закрываем себя (окно, из которого открывалось окно главного меню)
+        self.hide()     # скрываем себя: меню переиспользует раздел при следующем открытии
+
+
+    def reset_chapter(self) -> None:
+        """
+        Приводит уже созданный раздел к состоянию только что открытого перед
+        повторным показом из меню. Разделы, которым нечего сбрасывать,
+        этот метод не переопределяют
+        """
+        pass
 
 
     def open_window(self, frame_x, frame_y) -> None:
@@ -0,0 +1,238 @@
+from collections import deque
+
+
+class Board:
+    """
+    Реализует игровое поле без привязки к Qt: хранит расположение мин, открытые
+    клетки и флаги, а также правила игры. Все состояния хранятся в плоских
+    массивах bytearray длиной field_size², где клетка (row, col) имеет индекс
+    row * field_size + col. Количество соседних мин считается один раз при
+    расстановке мин, а количество открытых клеток поддерживается счетчиком,
+    поэтому любая проверка выполняется за O(1) даже на очень больших полях
+    """
+
+    def __init__(self, field_size: int, count_mines: int):
+        if not 0 <= count_mines < field_size ** 2:
+            raise ValueError("count_mines must be less than the number of cells")
+
+        self.field_size = field_size
+        self.count_mines = count_mines
+        self.cells_count = field_size ** 2
+
+        # плоские массивы состояний поля: 1 - мина/открыта/флаг, 0 - нет
+        self.mines = bytearray(self.cells_count)
+        self.revealed = bytearray(self.cells_count)
+        self.flags = bytearray(self.cells_count)
+
+        # количество мин в соседних клетках, считается при расстановке мин
+        self.adjacent = bytearray(self.cells_count)
+
+        # индексы клеток с минами (для перебора мин без обхода всего поля)
+        self.mines_indexes = []
+
+        self.revealed_count = 0
+        self.mines_placed = False
+
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Переводит координаты клетки в индекс плоского массива
+        """
+        return row * self.field_size + col
+
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Переводит индекс плоского массива в координаты клетки
+        """
+        return divmod(index, self.field_size)
+
+
+    @property
+    def mines_positions(self) -> list[tuple[int, int]]:
+        """
+        Возвращает координаты всех мин на поле
+        """
+        return [self.position(index) for index in self.mines_indexes]
+
+
+    def place_mines(self, indexes: list[int]) -> None:
+        """
+        Расставляет мины по переданным индексам и заранее считает количество
+        соседних мин для каждой клетки
+        """
+        self.mines = bytearray(self.cells_count)
+        self.adjacent = bytearray(self.cells_count)
+        self.mines_indexes = list(indexes)
+        self.count_mines = len(self.mines_indexes)
+
+        size = self.field_size
+        for index in self.mines_indexes:
+            self.mines[index] = 1
+
+            # увеличиваем счетчик у каждой соседней клетки (включая саму мину,
+            # для нее значение все равно не используется)
+            row, col = divmod(index, size)
+            for r in range(max(0, row - 1), min(size, row + 2)):
+                base = r * size
+                for c in range(max(0, col - 1), min(size, col + 2)):
+                    self.adjacent[base + c] += 1
+
+        self.mines_placed = True
+
+
+    def take_mines(self, other: "Board") -> None:
+        """
+        Переносит на поле расстановку мин (вместе с уже посчитанным количеством
+        соседних мин) с другого поля того же размера, например сгенерированного заранее
+        """
+        if other.field_size != self.field_size:
+            raise ValueError("boards must have the same size")
+
+        self.mines, self.adjacent = other.mines, other.adjacent
+        self.mines_indexes = other.mines_indexes
+        self.count_mines = other.count_mines
+        self.mines_placed = other.mines_placed
+
+
+    def move_mine(self, index: int, target: int) -> None:
+        """
+        Переносит мину из клетки index в свободную клетку target. Количество
+        соседних мин пересчитывается только вокруг этих двух клеток
+        """
+        if not self.mines[index] or self.mines[target]:
+            raise ValueError("mine must be moved from a mined cell to a free one")
+
+        self.mines[index], self.mines[target] = 0, 1
+        self.mines_indexes[self.mines_indexes.index(index)] = target
+
+        size = self.field_size
+        for cell, delta in ((index, -1), (target, 1)):
+            row, col = divmod(cell, size)
+            for r in range(max(0, row - 1), min(size, row + 2)):
+                base = r * size
+                for c in range(max(0, col - 1), min(size, col + 2)):
+                    self.adjacent[base + c] += delta
+
+
+    def neighbours(self, row: int, col: int) -> list[tuple[int, int]]:
+        """
+        Возвращает координаты соседних клеток относительно данной
+        """
+        return [
+            (r, c)
+            for r in range(max(0, row - 1), min(self.field_size, row + 2))
+            for c in range(max(0, col - 1), min(self.field_size, col + 2))
+            if r != row or c != col
+        ]
+
+
+    def is_mine(self, row: int, col: int) -> bool:
+        """
+        Проверяет, есть ли в клетке мина
+        """
+        return bool(self.mines[self.index(row, col)])
+
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        """
+        Проверяет, открыта ли клетка
+        """
+        return bool(self.revealed[self.index(row, col)])
+
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        """
+        Проверяет, установлен ли в клетке флаг
+        """
+        return bool(self.flags[self.index(row, col)])
+
+
+    def adjacent_mines(self, row: int, col: int) -> int:
+        """
+        Возвращает количество мин в соседних клетках относительно данной
+        """
+        return self.adjacent[self.index(row, col)]
+
+
+    def reveal(self, row: int, col: int) -> bool:
+        """
+        Открывает клетку. Возвращает True, если клетка не была открыта
+        раньше, и False в противном случае
+        """
+        index = self.index(row, col)
+        if self.revealed[index]:
+            return False
+
+        self.revealed[index] = 1
+        self.revealed_count += 1
+        return True
+
+
+    def reveal_area(self, row: int, col: int) -> list[tuple[int, int]]:
+        """
+        Открывает клетку, а если рядом с ней нет мин, то и всю область пустых
+        клеток вместе с ее границей из цифр. Обход выполняется в ширину без
+        рекурсии. Клетки с флагами не открываются. Возвращает координаты всех
+        клеток, открытых этим вызовом
+        """
+        start = self.index(row, col)
+        if self.revealed[start] or self.flags[start] or self.mines[start]:
+            return []
+
+        size = self.field_size
+        revealed, flags, adjacent = self.revealed, self.flags, self.adjacent
+
+        revealed[start] = 1
+        opened = [start]
+        queue = deque(opened)
+
+        while queue:
+            index = queue.popleft()
+            if adjacent[index]:     # у клетки с цифрой соседей не раскрываем
+                continue
+
+            r, c = divmod(index, size)
+            for nr in range(max(0, r - 1), min(size, r + 2)):
+                base = nr * size
+                for nc in range(max(0, c - 1), min(size, c + 2)):
+                    neighbour = base + nc
+                    # у пустой клетки соседи не могут быть минами
+                    if not revealed[neighbour] and not flags[neighbour]:
+                        revealed[neighbour] = 1
+                        opened.append(neighbour)
+                        queue.append(neighbour)
+
+        self.revealed_count += len(opened)
+        return [divmod(index, size) for index in opened]
+
+
+    def toggle_flag(self, row: int, col: int) -> bool:
+        """
+        Устанавливает или снимает флаг с закрытой клетки. Возвращает True,
+        если после вызова в клетке стоит флаг
+        """
+        index = self.index(row, col)
+        if not self.revealed[index]:
+            self.flags[index] ^= 1
+        return bool(self.flags[index])
+
+
+    def is_cleared(self) -> bool:
+        """
+        Проверяет, открыты ли все клетки без мин
+        """
+        return self.revealed_count + self.count_mines == self.cells_count
+
+
+    def reset(self) -> None:
+        """
+        Сбрасывает поле к состоянию до первого хода
+        """
+        self.mines = bytearray(self.cells_count)
+        self.revealed = bytearray(self.cells_count)
+        self.flags = bytearray(self.cells_count)
+        self.adjacent = bytearray(self.cells_count)
+        self.mines_indexes = []
+        self.revealed_count = 0
+        self.mines_placed = False
@@ -1,11 +1,14 @@
 from frontend.chapters.game_interface import GameInterface
 
 from backend.modules.basic_window_of_functionality import BasicWindowFunctionality
+from backend.modules.board import Board
+from backend.modules.mines_generator import generate_mines, generate_board, clear_opening
+from backend.modules.solver import Solver
+from backend.modules.storage import get_storage
+from backend.modules.achievements_store import get_achievements_store
 
-import sqlite3
-import csv
-
-import random
+from frontend.widgets.board_widget import BoardWidget
+from frontend.resources import get_icon
 
 from PyQt6.QtWidgets import QPushButton, QInputDialog, QWidget, QMainWindow
 from PyQt6.QtGui import QFont, QIcon
@@ -13,9 +16,14 @@ from PyQt6.QtCore import QSize, QTimer
 
 from data import load_config
 
+from concurrent.futures import ThreadPoolExecutor
+
+
+# поток, в котором заранее, пока игрок еще не сделал первый ход, генерируется следующее поле
+mines_executor = ThreadPoolExecutor(max_workers=1)
+
 
 class Game(GameInterface, BasicWindowFunctionality):
-    config = load_config()
     """
     Реализует backend часть раздела самой игры. Наследуется от двух классов:
     GameInterface (frontend часть самой игры) и BasicWindowFunctionality (класс
@@ -33,7 +41,7 @@ class Game(GameInterface, BasicWindowFunctionality):
             self.to_menu_button: self.open_menu_chapter,
             self.install_flag_button: self.change_click_mode,
             self.restart_game_button: self.restart_game,
-            self.clue_button: self.show_mine
+            self.clue_button: self.show_clue
         }
         self.connect_buttons_and_funcs(buttons)
 
@@ -45,39 +53,38 @@ class Game(GameInterface, BasicWindowFunctionality):
         self.difficulty, self.mode, self.clue = self.settings['difficulty'], self.settings['mode'], self.settings['clue']
 
         # 5. Выбираем размер поля и количество мин в зависимости от уровня сложности
-        levels_and_settings = {
-            "Beginner": self.config.backend.game_parameters.field_sizes.beginner,
-            "Professional": self.config.backend.game_parameters.field_sizes.professional,
-        }
-        self.field_size_and_count_mines = levels_and_settings[self.difficulty]
-        self.field_size = levels_and_settings[self.difficulty][0]
-        self.count_mines = levels_and_settings[self.difficulty][1]
+        self.field_size_and_count_mines = self.get_field_size_and_count_mines()
+        self.field_size, self.count_mines = self.field_size_and_count_mines
 
         # 6. Предстартовая подготовка. Инициализируем переменные заранее, чтобы избежать их
         # инициализации в методах
-            # поле в двумерном массиве, с отображением клеток, в которых расположены мины
-        self.revealed = [
-            [False for _ in range(self.field_size)]
-                         for _ in range(self.field_size)
-        ]
-
-            # поле в двумерном массиве, с отображением клеток, в которых установлен флаг
-            # в отличие от flags.positions, необходим для отслеживания состояния всего поля
-        self.flags = [
-            [False for _ in range(self.field_size)]
-            for _ in range(self.field_size)
-        ]
-
-            # списки с позициями мин и подсказок
-        self.mines_positions, self.clues_positions = [], []
-
-            # список клеток, в которых пользователь верно установил флаг, необходимо для
-            # отслеживания достижения
-        self.flags_positions = []
+            # игровое поле: мины, открытые клетки и флаги (правила игры без привязки к Qt)
+        self.board = Board(self.field_size, self.count_mines)
+
+            # решатель, по цифрам на поле находящий безопасные клетки для подсказок
+            # (создается при первой подсказке), открытые клетки, о которых он еще
+            # не знает, и клетки с уже показанными минами
+        self.solver = None
+        self.solver_queue = []
+        self.shown_clues = set()
+
+            # зерно генератора мин (None - случайные поля), задается для воспроизводимых прогонов
+        self.seed = None
+
+            # поле с минами, заранее генерируемое в фоне (Future с Board)
+        self.prefetched_board = None
+        self.prefetch_board()
+
+            # клетки, в которых пользователь верно установил флаг, необходимо для
+            # отслеживания достижения (повторный флаг на той же мине не засчитывается)
+        self.flags_positions = set()
 
             # делает ли пользователь сейчас первый ход, необходимо для инициализации мин
         self.first_move = True
 
+            # закончена ли игра (победой или проигрышем): подсказки и флаги после нее недоступны
+        self.game_over = False
+
             # пользователь устанавливает флаг на клетке или открывает ее
         self.flag_setting_mode = False
 
@@ -86,14 +93,19 @@ class Game(GameInterface, BasicWindowFunctionality):
         self.install_flag_button.setEnabled(False)
         self.clue_button.setEnabled(False)
 
+            # достижения игрока хранятся в памяти и записываются на диск в конце игры
+        self.achievements = get_achievements_store(self.config.backend.data.achievements)
+
             # инициализируем переменные заранее, чтобы избежать их инициализации в методах
-        self.count_wins, self.beginner_level = None, None
-        self.professional_level, self.count_marked_mines = None, None
         self.width, self.height = None, None
         self.shift, self.x, self.y, self.start_x = None, None, None, None
         self.font_family, self.font_size = None, None
         self.buttons = []
 
+            # поле рисуется одним виджетом (painted) или сеткой кнопок (buttons)
+        self.field_mode = self.config.backend.game_parameters.field_mode
+        self.board_widget = None
+
         # 7. Создаем поле
         self.generate_field()
 
@@ -106,15 +118,31 @@ class Game(GameInterface, BasicWindowFunctionality):
         self.time_elapsed = 0
 
 
+    def get_field_size_and_count_mines(self) -> tuple[int, int]:
+        """
+        Возвращает размер поля и количество мин для выбранного уровня сложности
+        """
+        levels_and_settings = {
+            "Beginner": self.config.backend.game_parameters.field_sizes.beginner,
+            "Professional": self.config.backend.game_parameters.field_sizes.professional,
+        }
+        return levels_and_settings[self.difficulty]
+
+
     def generate_field(self) -> None:
         """
         Координирующий метод, осуществляющий загрузку настроек
         для поля, рисующий поле и подключающий клетки поля к
-        lambda функции
+        обработчикам нажатий. Поле рисуется одним виджетом, а при
+        field_mode = "buttons" - сеткой из кнопок
         """
         self.load_cell_parameters()
-        self.draw_field()
-        self.connect_field_buttons_and_funcs()
+
+        if self.field_mode == "painted":
+            self.draw_board_widget()
+        else:
+            self.draw_field()
+            self.connect_field_buttons_and_funcs()
 
 
     def load_cell_parameters(self) -> None:
@@ -136,6 +164,28 @@ class Game(GameInterface, BasicWindowFunctionality):
         self.font_size = self.config.backend.game_parameters.font_settings.font_size # размер шрифта
 
 
+    def draw_board_widget(self) -> None:
+        """
+        Вспомогательный метод для generate_field, создающий виджет поля,
+        который сам рисует все клетки, и подключающий его сигналы
+        """
+        self.board_widget = BoardWidget(
+            self,
+            self.board,
+            cell_size=(self.width, self.height),
+            shift=self.shift,
+            start_position=(self.x, self.y),
+            font=QFont(self.font_family, self.font_size),
+            images={
+                'field': self.config.frontend.game_utils.field,
+                'flag': self.config.frontend.buttons.flag_on_field,
+                'mine': self.config.frontend.game_utils.mine
+            }
+        )
+        self.board_widget.cell_clicked.connect(self.on_button_click)    # левый клик - действие по режиму
+        self.board_widget.cell_right_clicked.connect(self.on_flag_click)    # правый клик - флаг
+
+
     def draw_field(self) -> None:
         """
         Вспомогательный метод для generate_field, осуществляющий загрузку
@@ -154,7 +204,7 @@ class Game(GameInterface, BasicWindowFunctionality):
 
                 row_buttons.append(button)  # добавляем кнопку к остальным кнопкам этого ряда
 
-                button.setIcon(QIcon(self.config.frontend.game_utils.field)) # изменяем иконку
+                button.setIcon(get_icon(self.config.frontend.game_utils.field)) # изменяем иконку
                 button.setIconSize(QSize(self.width, self.height))
 
                 # убираем строгий контур кнопок и делаем цвет текста черным в отключенном состоянии
@@ -198,17 +248,11 @@ class Game(GameInterface, BasicWindowFunctionality):
         установка флага в клетку, поиск количества соседних мин, изменение достижений
         пользователя и многое другое
         """
-        button = self.buttons[row][col]
-
         if self.first_move: # если первый ход
             self.initialize_mines(row, col) # инициализируем мины
 
             self.first_move = False
-            count = self.count_adjacent_mines(row, col) # выводим количество соседних мин
-            button.setText(f"{count}")
-            button.setEnabled(False)  # отключаем кнопку, чтобы нельзя было нажать еще раз
-            button.setIcon(QIcon())
-            self.revealed[row][col] = True  # добавляем в список открытых ячеек
+            self.reveal_cells(row, col)  # открываем клетку (и пустую область вокруг нее)
 
             self.install_flag_button.setEnabled(True)   # разрешаем установку флага
 
@@ -218,60 +262,84 @@ class Game(GameInterface, BasicWindowFunctionality):
             else:
                 self.start_timer()
 
+            self.check_is_game_finished()   # пустая область могла открыть все поле
+
         elif self.flag_setting_mode:    # если у нас выбран режим установки флага
-            self.toggle_flag(row, col)
-
-            # если раннее в этой клетки не было флага и в этой клетке есть мина
-            if (row, col) in self.mines_positions and (row, col) not in self.flags:
-                self.flags_positions.append((row, col))
-
-                if self.mode == "Timed":
-                    self.unpack_player_achievements()   # получаем достижения игрока
-                    self.count_marked_mines = str(int(self.count_marked_mines) + 1) # добавляем одну отмеченную флагом мину
-                    self.update_player_achievements(self.pack_player_achievements()) # обновляем таблицу достижений
-                    self.check_is_game_finished()   # проверяем на окончание игры
-
-        elif (row, col) not in self.mines_positions:    # если мы попали в клетку без мины
-            count = self.count_adjacent_mines(row, col) # отображаем количество мин рядом с данной клеткой
-            button.setText(f"{count}")
-            button.setEnabled(False)
-            button.setIcon(QIcon())
-            self.revealed[row][col] = True
+            self.place_flag(row, col)
+
+        elif not self.board.is_mine(row, col):    # если мы попали в клетку без мины
+            self.reveal_cells(row, col) # открываем клетку (и пустую область вокруг нее)
             self.check_is_game_finished()   # проверяем на окончание игры
 
-        elif (row, col) in self.mines_positions:    # если нажали на клетку с миной
+        else:    # если нажали на клетку с миной
+            self.game_over = True
             self.stop_timer()
             self.disable_all_buttons()
             self.game_win_over_label.setText("You have lost")
             self.show_mines()
+            self.achievements.flush()   # записываем накопленные за игру достижения на диск
 
 
-    def check_is_game_finished(self) -> None:
+    def on_flag_click(self, row: int, col: int) -> None:
         """
-        Проверяет игру на окончание. Сравнивает сумму открытых ячек и количества
-        мин с количеством ячеек на поле
+        Метод, к которому подключен правый клик по полю. Устанавливает флаг
+        независимо от выбранного режима (до первого хода флаги недоступны)
         """
-        count = self.count_true(self.revealed)
+        if not self.first_move:
+            self.place_flag(row, col)
 
-        if count + self.count_mines == self.field_size ** 2:
-            self.stop_game()
+
+    def place_flag(self, row: int, col: int) -> None:
+        """
+        Устанавливает или снимает флаг и, если флагом отмечена мина,
+        обновляет достижения пользователя
+        """
+        # если флаг был установлен (а не снят) и в этой клетке есть мина
+        if self.toggle_flag(row, col) and self.board.is_mine(row, col):
+            if (row, col) in self.flags_positions:  # эта мина уже была отмечена в этой игре
+                return
+            self.flags_positions.add((row, col))
+
+            if self.mode == "Timed":
+                # добавляем одну отмеченную флагом мину (на диск достижения запишутся в конце игры)
+                self.achievements.increment(self.config.backend.achievements.texts.count_marked_mines_text)
+                self.check_is_game_finished()   # проверяем на окончание игры
 
 
-    def unpack_player_achievements(self) -> None:
+    def reveal_cells(self, row: int, col: int) -> None:
         """
-        Получает достижения игрока и отображает их
+        Открывает клетку, а если рядом с ней нет мин - всю пустую область вокруг.
+        Сначала поле вычисляет все открываемые клетки, затем кнопки обновляются
+        одним пакетом с отключенной перерисовкой окна
         """
-        achievements = self.get_player_achievements()
+        cells = self.board.reveal_area(row, col)
+        if not cells:
+            return
+
+        if self.solver is not None:     # решатель узнает об открытых клетках при подсказке
+            self.solver_queue.extend(cells)
+
+        if self.board_widget:   # виджет поля перерисует только область открытых клеток
+            self.board_widget.update_cells(cells)
+            return
+
+        self.setUpdatesEnabled(False)   # отключаем перерисовку на время обновления кнопок
+        empty_icon = QIcon()
+        for r, c in cells:
+            button = self.buttons[r][c]
+            button.setText(f"{self.count_adjacent_mines(r, c)}")  # количество соседних мин
+            button.setEnabled(False)  # отключаем кнопку, чтобы нельзя было нажать еще раз
+            button.setIcon(empty_icon)
+        self.setUpdatesEnabled(True)    # окно перерисуется один раз
+
 
-        for achievement, achievement_item in achievements.items():
-            if achievement == self.config.backend.achievements.texts.count_wins_text:
-                self.count_wins = achievement_item
-            elif achievement == self.config.backend.achievements.texts.complete_beginner_level_text:
-                self.beginner_level = achievement_item
-            elif achievement == self.config.backend.achievements.texts.complete_professional_level_text:
-                self.professional_level = achievement_item
-            elif achievement == self.config.backend.achievements.texts.count_marked_mines_text:
-                self.count_marked_mines = achievement_item
+    def check_is_game_finished(self) -> None:
+        """
+        Проверяет игру на окончание. Сравнивает сумму открытых ячек и количества
+        мин с количеством ячеек на поле
+        """
+        if self.board.is_cleared():
+            self.stop_game()
 
 
     def stop_game(self) -> None:
@@ -279,6 +347,7 @@ class Game(GameInterface, BasicWindowFunctionality):
         Осуществляет окончание игры: останавливает таймер, отключает все кнопки,
         выводит текст об окончании, получает никнейм игрока и обновляет его достижения
         """
+        self.game_over = True
         self.stop_timer()
         self.disable_all_buttons()
 
@@ -287,30 +356,15 @@ class Game(GameInterface, BasicWindowFunctionality):
         if self.mode == "Timed":    # если игра была на время
             self.update_leaders(self.get_user_name(), self.field_size)  # обновляем таблицу лидеров
 
-            self.unpack_player_achievements()   # получаем достижения пользователя
-
-            self.count_wins = str(int(self.count_wins) + 1) # обновляем достижения пользователя
+            texts = self.config.backend.achievements.texts
+            self.achievements.increment(texts.count_wins_text) # обновляем достижения пользователя
 
             if self.difficulty == "Beginner":
-                self.beginner_level = "1"
+                self.achievements.set(texts.complete_beginner_level_text, 1)
             elif self.difficulty == "Professional":
-                self.professional_level = "1"
+                self.achievements.set(texts.complete_professional_level_text, 1)
 
-            self.update_player_achievements(self.pack_player_achievements())    # загружаем обновленные достижения
-
-
-    def pack_player_achievements(self) -> dict:
-        """
-        Запаковывает достижения игрока в словарь для дальнейшей загрузки
-        в таблицу
-        """
-        # словарь в формате: {"Название достижения": значение_достижения_пользователя}
-        return {
-            self.config.backend.achievements.texts.count_wins_text: self.count_wins,
-            self.config.backend.achievements.texts.complete_beginner_level_text: self.beginner_level,
-            self.config.backend.achievements.texts.complete_professional_level_text: self.professional_level,
-            self.config.backend.achievements.texts.count_marked_mines_text: self.count_marked_mines
-        }
+        self.achievements.flush()   # записываем накопленные за игру достижения на диск
 
 
     def update_leaders(self, name: str, field_size: int) -> None:
@@ -318,21 +372,7 @@ class Game(GameInterface, BasicWindowFunctionality):
         Вносит в таблицу лидеров нового игрока: его никнейм,
         уровень сложности, на котором он завершил игру, и его время прохождения
         """
-        con = sqlite3.connect(self.config.backend.data.storage) # подключаемся к таблице
-        cur = con.cursor()
-
-        cur.execute(    # обновляем таблицу
-            """
-        INSERT INTO
-            leaders (nickname, time, field_size)
-        VALUES
-            (?, ?, ?)        
-        """,
-            (name, self.timer_label.text(), self.difficulty),
-        )
-
-        con.commit()    # сохраняем результат
-        con.close()
+        get_storage(self.config.backend.data.storage).record_result(name, self.time_elapsed, self.difficulty)
 
 
     @staticmethod
@@ -381,78 +421,64 @@ class Game(GameInterface, BasicWindowFunctionality):
         """
         Получает настройки пользователя и возвращает их в удобном формате
         """
-        con = sqlite3.connect(self.config.backend.data.storage)
-        cur = con.cursor()
-
-        row = cur.execute(
-            """
-        SELECT
-            game_difficulty, game_mode, clue
-        FROM
-            settings
-        WHERE
-            key=0
-        """
-        ).fetchall()[0]
+        row = get_storage(self.config.backend.data.storage).load_settings()
 
         return {"difficulty": row[0], "mode": row[1], 'clue': row[2]} 
 
 
-    def get_player_achievements(self) -> dict:
+    def show_clue(self) -> None:
         """
-        Получает текущие данные из таблицы достижений пользователя
+        Подсказка (вызывается пользователем при помощи кнопки подсказки). Открывает
+        клетку, которая по цифрам на поле гарантированно безопасна. Если такой клетки
+        нет, отображает мину, наличие которой можно доказать по цифрам
         """
-        with open(self.config.backend.data.achievements, "r", encoding="utf8") as csvfile:
-            rows = list(csv.reader(csvfile, delimiter=";", quotechar='"'))
-            return {row[0]: row[1] for row in rows}
+        if self.first_move or self.game_over:
+            return
 
+        solver = self.get_solver()
+        safe, _ = solver.find_safe_cells()
+        for index in sorted(safe):
+            if not self.board.flags[index]:
+                self.reveal_cells(*self.board.position(index))
+                self.check_is_game_finished()
+                return
 
-    def update_player_achievements(self, player_achievements: dict) -> None:
-        """
-        Обновляет таблицу достижений пользователя, загружая в нее новые данные
-        """
-        with open(self.config.backend.data.achievements, "w", newline="", encoding="utf8") as csvfile:
-            writer = csv.writer(
-                csvfile, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL
-            )
-            writer.writerows(list([k, v] for k, v in player_achievements.items()))
+        for index in self.board.mines_indexes:
+            if solver.mines[index] and not self.board.flags[index] and index not in self.shown_clues:
+                self.shown_clues.add(index)
+                row, col = self.board.position(index)
+
+                if self.board_widget:
+                    self.board_widget.show_mines([(row, col)])
+                else:
+                    self.buttons[row][col].setIcon(get_icon(self.config.frontend.game_utils.mine))
+                return
 
 
-    def show_mine(self) -> None:
+    def get_solver(self) -> Solver:
         """
-        Отображает на поле случайную мину (вызывается пользователем при помощи
-        кнопки подсказки)
+        Возвращает решатель, знающий обо всех открытых клетках. Решатель создается
+        только при первой подсказке (в режиме Timed и без подсказок он не нужен),
+        а открытые после этого клетки передаются ему одним пакетом
         """
-        if self.clues_positions:
-            coordinates = random.choice(self.clues_positions)
-            for item in self.clues_positions:
-                if item == coordinates:
-                    self.clues_positions.remove(coordinates)
-            self.buttons[coordinates[0]][coordinates[1]].setIcon(
-                QIcon(self.config.frontend.game_utils.mine)
-            )
+        if self.solver is None:
+            self.solver = Solver(self.board)    # решатель сам учтет уже открытые клетки
+        elif self.solver_queue:
+            self.solver.update(self.solver_queue)
+        self.solver_queue = []
+        return self.solver
 
 
     def show_mines(self) -> None:
         """
         Отображает все мины на поле (используется в случае проигрыша пользователя)
         """
-        for item in self.mines_positions:
-            self.buttons[item[0]][item[1]].setIcon(QIcon(self.config.frontend.game_utils.mine))
+        if self.board_widget:
+            self.board_widget.show_mines(self.board.mines_positions)
+            return
 
-
-    @staticmethod
-    def count_true(field: list[list]) -> int:
-        """
-        Осуществляет подсчет количества True в
-        в переданном поле. Например, считает количество открытых ячеек
-        """
-        count = 0
-        for row in field: # для каждого ряда
-            for cell in row:    # для каждой ячейки в ряду
-                if cell:
-                    count += 1
-        return count
+        for item in self.board.mines_positions:
+            self.buttons[item[0]][item[1]].setIcon(get_icon(self.config.frontend.game_utils.mine))
 
 
     def restart_game(self) -> None:
@@ -463,16 +489,20 @@ class Game(GameInterface, BasicWindowFunctionality):
         self.clue_button.setEnabled(False)
         self.install_flag_button.setEnabled(False)
         self.first_move = True
+        self.game_over = False
 
-        self.revealed = [
-            [False for _ in range(self.field_size_and_count_mines[0])]
-            for _ in range(self.field_size_and_count_mines[0])
-        ]
+        self.board.reset()  # сбрасываем мины, открытые клетки и флаги
+        self.flags_positions = set()
+        self.solver = None
+        self.solver_queue = []
+
+        if self.board_widget:
+            self.board_widget.reset()
         self.game_win_over_label.setText("")
 
         for i in range(len(self.buttons)):
             for j in range(len(self.buttons[i])):
-                self.buttons[i][j].setIcon(QIcon(self.config.frontend.game_utils.field))
+                self.buttons[i][j].setIcon(get_icon(self.config.frontend.game_utils.field))
                 self.buttons[i][j].setText("")
                 self.buttons[i][j].setStyleSheet(
                         """
@@ -496,18 +526,69 @@ class Game(GameInterface, BasicWindowFunctionality):
                 button.setText("")
                 button.setEnabled(True)
 
+        self.prefetch_board()   # пока игрок не сделал первый ход, готовим поле в фоне
+
+
+    def reset_chapter(self) -> None:
+        """
+        Подготавливает раздел к повторному открытию из меню: заново загружает
+        настройки пользователя, пересоздает поле только при смене уровня
+        сложности и начинает новую игру
+        """
+        self.settings = self.get_player_settings()
+        difficulty, self.mode, self.clue = self.settings['difficulty'], self.settings['mode'], self.settings['clue']
+
+        if difficulty != self.difficulty:   # у другого уровня другой размер поля
+            self.difficulty = difficulty
+            self.field_size_and_count_mines = self.get_field_size_and_count_mines()
+            self.field_size, self.count_mines = self.field_size_and_count_mines
+
+            self.remove_field()
+            self.board = Board(self.field_size, self.count_mines)
+            self.prefetched_board = None    # заготовленное поле другого размера не подойдет
+            self.generate_field()
+
+        self.flag_setting_mode = False
+        self.label.show()   # надпись "Timer: " скрывается в режиме Casual
+        self.reset_timer()  # игра могла быть брошена на середине
+        self.update_clue_button()
+        self.restart_game()
 
-    def toggle_flag(self, row: int, col: int) -> None:
+
+    def remove_field(self) -> None:
+        """
+        Вспомогательный метод для reset_chapter, удаляющий виджет поля
+        или сетку кнопок
+        """
+        if self.board_widget:
+            self.board_widget.deleteLater()
+            self.board_widget = None
+
+        for row in self.buttons:
+            for button in row:
+                button.deleteLater()
+        self.buttons = []
+
+
+    def toggle_flag(self, row: int, col: int) -> bool:
         """
         Осуществляет установку флага в указанную клетку:
-        изменяет иконку клетки, добавляет в список клеток с флагом
+        изменяет иконку клетки и состояние поля. Возвращает True,
+        если флаг был установлен
         """
-        if not self.revealed[row][col]:
-            if self.flags[row][col]:
-                self.buttons[row][col].setIcon(QIcon(self.config.frontend.game_utils.field))
-            else:
-                self.buttons[row][col].setIcon(QIcon(self.config.frontend.buttons.flag_on_field))
-            self.flags[row][col] = not self.flags[row][col]
+        if self.board.is_revealed(row, col):
+            return False
+
+        flagged = self.board.toggle_flag(row, col)
+
+        if self.board_widget:
+            self.board_widget.update_cells([(row, col)])
+        elif flagged:
+            self.buttons[row][col].setIcon(get_icon(self.config.frontend.buttons.flag_on_field))
+        else:
+            self.buttons[row][col].setIcon(get_icon(self.config.frontend.game_utils.field))
+
+        return flagged
 
 
     def change_click_mode(self) -> None:
@@ -523,8 +604,14 @@ class Game(GameInterface, BasicWindowFunctionality):
 
     def disable_all_buttons(self) -> None:
         """
-        Делает все кнопки (поля) недоступными для нажатия
+        Делает все кнопки (поля, подсказки и установки флага) недоступными для нажатия
         """
+        self.clue_button.setEnabled(False)
+        self.install_flag_button.setEnabled(False)
+
+        if self.board_widget:
+            self.board_widget.setEnabled(False) # виджет перерисуется с серым текстом
+
         for row in self.buttons:
             for button in row:
                 button.setEnabled(False)
@@ -548,13 +635,7 @@ class Game(GameInterface, BasicWindowFunctionality):
         Осуществляет подсчет количества мин в соседних клетках относительно
         данной
         """
-        count = 0
-
-        # цикл проходится по каждому соседнему ряду и каждому соседнему столбцу относительно данной ячейки
-        for r in range(max(0, row - 1), min(self.field_size, row + 2)):
-            for c in range(max(0, col - 1), min(self.field_size, col + 2)):
-                if (r, c) in self.mines_positions:
-                    count += 1
+        count = self.board.adjacent_mines(row, col) # значение заранее посчитано при расстановке мин
 
         if count == 0:  # если не найдено количество мин, в клетку установится ""
             return ""
@@ -564,18 +645,33 @@ class Game(GameInterface, BasicWindowFunctionality):
 
     def initialize_mines(self, first_move_row: int, first_move_col: int) -> None:
         """
-        Генерирует позиции мин на поле, исключаяя клетку первого хода
+        Расставляет мины на поле, исключая клетку первого хода и соседние с ней
+        клетки, чтобы первый ход открывал область. Если поле уже сгенерировано в фоне,
+        из области первого хода лишь переносятся мины, иначе поле генерируется сразу
         """
-        positions = [
-            (r, c)
-            for r in range(self.field_size)
-            for c in range(self.field_size)
-            if r != first_move_row or c != first_move_col
-        ]
+        first_move = (first_move_row, first_move_col)
+        prefetched, self.prefetched_board = self.prefetched_board, None
+
+        if prefetched is not None and prefetched.done() and not prefetched.exception():
+            self.board.take_mines(prefetched.result())
+            clear_opening(self.board, first_move, seed=self.seed)
+        else:
+            if prefetched is not None:
+                prefetched.cancel()     # не дожидаемся фоновой генерации
+            self.board.place_mines(generate_mines(self.field_size, self.count_mines, first_move, seed=self.seed))
 
+        self.solver = None
+        self.solver_queue = []
+        self.shown_clues = set()
 
-        self.mines_positions = random.sample(positions, self.count_mines) # генерируем count_mines пар row-col
-        self.clues_positions = self.mines_positions[:]
+
+    def prefetch_board(self) -> None:
+        """
+        Ставит генерацию поля для следующей игры в очередь фонового потока,
+        если заготовленного поля еще нет
+        """
+        if self.prefetched_board is None:
+            self.prefetched_board = mines_executor.submit(generate_board, self.field_size, self.count_mines, self.seed)
 
 
     def update_clue_button(self) -> None:
@@ -1,12 +1,9 @@
 from frontend.chapters.leaderboard_interface import LeaderboardInterface
 
 from backend.modules.basic_window_of_functionality import BasicWindowFunctionality
+from backend.modules.leaderboard_model import LeaderboardModel
 
-import sqlite3
-
-from PyQt6.QtWidgets import QTableWidgetItem, QMainWindow
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QMainWindow
 
 
 class Leaderboard(LeaderboardInterface, BasicWindowFunctionality):
@@ -28,45 +25,46 @@ class Leaderboard(LeaderboardInterface, BasicWindowFunctionality):
         }
         self.connect_buttons_and_funcs(buttons)
 
-        # 3. Загружаем таблицу лидеров
+        # 3. Подключаем к таблице модель, которая постранично загружает лидеров
+        self.leaderboard_model = LeaderboardModel(self.config.backend.data.storage, self)
+        self.leaderboard_model.page_loaded.connect(self.update_search_result)
+        self.setup_table()
+
+        # 4. Загружаем таблицу лидеров
         self.update_leaderboard()
 
 
-    def update_leaderboard(self) -> None:
+    def reset_chapter(self) -> None:
         """
-        Метод, координирующий заполнение таблицы. Получает выбранный уровень
-        сложности, загружает данные для данного уровня сложности и заполняет
-        таблицу
+        Перед повторным открытием раздела выбирает первый уровень сложности
+        и заново загружает таблицу (могли появиться новые результаты)
         """
-        selected_text = self.get_selected_level_text()
-        data = self.load_leaderboard_data(selected_text)
-        self.filling_in_table(data)
+        self.choose_field_size.setCurrentIndex(0)
+        self.update_leaderboard()
 
 
-    def load_leaderboard_data(self, selected_text) -> list:
+    def setup_table(self) -> None:
         """
-        Вспомогательный метод для update_leaderboard, осуществляющий
-        получение данных по указанному уровню сложности
+        Вспомогательный метод для __init__, осуществляющий подключение модели
+        к таблице и однократную настройку ее внешнего вида
+        """
+        self.leaderboard_table_view.setModel(self.leaderboard_model)
+        self.leaderboard_table_view.verticalHeader().setVisible(False)
+
+        # размеры колонок таблицы лидеров
+        self.leaderboard_table_view.setColumnWidth(0, 80)
+        self.leaderboard_table_view.setColumnWidth(1, 200)
+        self.leaderboard_table_view.setColumnWidth(2, 118)
+
+
+    def update_leaderboard(self) -> None:
         """
-        con = sqlite3.connect(self.config.backend.data.storage)
-        cur = con.cursor()
-
-        result = cur.execute(
-            '''
-            SELECT
-                nickname, time
-            FROM
-                leaders
-            WHERE
-                field_size = ?
-            ORDER BY
-                time
-            ''',
-            (selected_text, )
-        ).fetchall() 
-        con.close()
-
-        return result
+        Метод, координирующий заполнение таблицы. Получает выбранный уровень
+        сложности и запускает загрузку данных для него. Записи подгружаются
+        моделью в фоне по мере прокрутки таблицы
+        """
+        selected_text = self.get_selected_level_text()
+        self.leaderboard_model.set_field_size(selected_text)
 
 
     def get_selected_level_text(self) -> str:
@@ -76,69 +74,16 @@ class Leaderboard(LeaderboardInterface, BasicWindowFunctionality):
         """
         selected_text = self.choose_field_size.currentText()
         return selected_text
-    
 
-    def filling_in_table(self, data: list) -> None:
+
+    def update_search_result(self) -> None:
         """
-        Вспомогательный метод для update_leaderboard, осущетсвляющий заполнение
-        таблицы лидеров по входным данным
+        Вызывается после загрузки каждой страницы таблицы. Выводит надпись,
+        если не найдено ни одной записи о завершении игры
         """
-        if not data: # если нету ни одной записи о завершении игры
+        if self.leaderboard_model.rowCount() == 0:
             self.label_result_of_search.setText(
                 'Unforunately, nothing was found'
             )
-            self.leaderboard_table_widget.setRowCount(0)
-
-        else:   # если есть хотя бы одна запись о завершении игры
-            self.label_result_of_search.setText('')
-            self.leaderboard_table_widget.setColumnCount(3)    # количество столбцов
-            self.leaderboard_table_widget.setRowCount(len(data))    # количество строк, равное количеству записей
-
-            # заголовки
-            self.leaderboard_table_widget.setHorizontalHeaderLabels(
-                ["Position", "Nickname", "Time"]
-            )
-            self.leaderboard_table_widget.verticalHeader().setVisible(False)
-
-            # размеры колонок таблицы лидеров
-            self.leaderboard_table_widget.setColumnWidth(0, 80)
-            self.leaderboard_table_widget.setColumnWidth(1, 200)
-            self.leaderboard_table_widget.setColumnWidth(2, 118)
-
-            # проходимся по каждой записи
-            for row_index, elem in enumerate(data):
-                # устанавливаем порядковый номер в таблице
-                position_item = QTableWidgetItem(str(row_index + 1)) # создаем модель элемента
-                position_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter) # располагаем по центру
-                self.leaderboard_table_widget.setItem(row_index, 0, position_item) # устанавливаем элемент в таблицу
-
-                # проходимся по каждому никнейму и соответсвующему ему времени
-                for j, val in enumerate(elem):
-                    item = QTableWidgetItem(str(val)) # создаем модель элемента
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter) # располагаем по центру
-                    self.leaderboard_table_widget.setItem(row_index, j + 1, item) # устанавливаем элемент в таблицу
-
-
-                # получаем цвет, зависящий от номера столбца
-                color = self.choose_color(row_index)
-
-                # раскрашиваем каждый столбец данной строки
-                for col in range(self.leaderboard_table_widget.columnCount()): 
-                    self.leaderboard_table_widget.item(row_index, col).setBackground(color) 
-
-
-    @staticmethod
-    def choose_color(row_index: int) -> QColor:
-        """
-        Вспомогательный метод для filling_in_table, осуществляющий выбор
-        цвета в зависимости от номера строки таблицы
-        """
-        if row_index == 0:
-            return QColor(255, 215, 0)
-        elif row_index == 1:
-            return QColor(192, 192, 192)
-        elif row_index == 2:
-            return QColor(204, 127, 51)
         else:
-            return QColor(255, 255, 255)
-
+            self.label_result_of_search.setText('')
@@ -0,0 +1,183 @@
+from backend.modules.storage import get_storage
+
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt6.QtGui import QColor
+
+import sqlite3
+
+
+class PageLoaderSignals(QObject):
+    """
+    Сигналы загрузчика страницы. QRunnable не является QObject, поэтому
+    сигналы вынесены в отдельный класс
+    """
+
+    # номер запроса и загруженные записи
+    loaded = pyqtSignal(int, list)
+
+
+class PageLoader(QRunnable):
+    """
+    Загружает одну страницу таблицы лидеров в фоновом потоке
+    """
+
+    def __init__(self, storage_path: str, field_size: str, after: tuple[int, int] | None,
+                 limit: int, generation: int):
+        super().__init__()
+        self.storage_path = storage_path
+        self.field_size, self.after, self.limit = field_size, after, limit
+        self.generation = generation
+        self.signals = PageLoaderSignals()
+
+
+    def run(self) -> None:
+        """
+        Выполняет запрос к базе и передает записи в поток интерфейса
+        """
+        try:
+            rows = get_storage(self.storage_path).load_leaders_page(self.field_size, self.after, self.limit)
+        except sqlite3.ProgrammingError:    # игра завершается, и база уже закрыта
+            return
+        self.signals.loaded.emit(self.generation, rows)
+
+
+class LeaderboardModel(QAbstractTableModel):
+    """
+    Модель таблицы лидеров для QTableView. Загружает записи постранично
+    (по ключу (время, rowid), без OFFSET) и только тогда, когда таблица
+    прокручена до конца уже загруженных строк. Запросы к базе выполняются
+    в фоновом потоке, поэтому интерфейс не замирает при любом размере таблицы
+    """
+
+    # испускается после загрузки каждой страницы
+    page_loaded = pyqtSignal()
+
+    headers = ["Position", "Nickname", "Time"]
+    page_size = 100
+
+    def __init__(self, storage_path: str, parent: QObject | None = None):
+        super().__init__(parent)
+        self.storage_path = storage_path
+
+        self.field_size = None
+        self.rows = []  # загруженные записи в формате: (время, rowid, никнейм)
+        self.has_more = False   # есть ли в базе еще не загруженные записи
+        self.loading = False    # выполняется ли сейчас загрузка страницы
+
+        # номер текущего запроса: ответы на устаревшие запросы отбрасываются
+        self.generation = 0
+
+
+    def set_field_size(self, field_size: str) -> None:
+        """
+        Сбрасывает загруженные записи и начинает загрузку таблицы лидеров
+        для указанного уровня сложности
+        """
+        self.beginResetModel()
+        self.field_size = field_size
+        self.rows = []
+        self.has_more = True
+        self.loading = False
+        self.generation += 1
+        self.endResetModel()
+
+        self.fetchMore(QModelIndex())
+
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Возвращает количество загруженных строк
+        """
+        return 0 if parent.isValid() else len(self.rows)
+
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Возвращает количество столбцов: позиция, никнейм и время
+        """
+        return 0 if parent.isValid() else len(self.headers)
+
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """
+        Проверяет, можно ли запустить загрузку следующей страницы
+        """
+        return not parent.isValid() and self.has_more and not self.loading
+
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """
+        Запускает загрузку следующей страницы в фоновом потоке
+        """
+        if not self.canFetchMore(parent):
+            return
+
+        after = self.rows[-1][:2] if self.rows else None    # ключ последней загруженной записи
+        loader = PageLoader(self.storage_path, self.field_size, after, self.page_size, self.generation)
+        loader.signals.loaded.connect(self.append_page)
+
+        self.loading = True
+        QThreadPool.globalInstance().start(loader)
+
+
+    def append_page(self, generation: int, rows: list) -> None:
+        """
+        Добавляет загруженную страницу в модель (вызывается в потоке интерфейса)
+        """
+        if generation != self.generation:   # ответ на устаревший запрос
+            return
+
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+
+        self.has_more = len(rows) == self.page_size
+        self.loading = False
+        self.page_loaded.emit()
+
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Возвращает текст, выравнивание и цвет ячейки. Первые три места
+        раскрашиваются в цвета пьедестала
+        """
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            time, _, nickname = self.rows[row]
+            return [str(row + 1), nickname, str(time)][column]  # позиция, никнейм, время
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.choose_color(row)
+        return None
+
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Возвращает заголовки столбцов
+        """
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+
+    @staticmethod
+    def choose_color(row_index: int) -> QColor:
+        """
+        Вспомогательный метод для data, осуществляющий выбор
+        цвета в зависимости от номера строки таблицы
+        """
+        if row_index == 0:
+            return QColor(255, 215, 0)
+        elif row_index == 1:
+            return QColor(192, 192, 192)
+        elif row_index == 2:
+            return QColor(204, 127, 51)
+        else:
+            return QColor(255, 255, 255)
@@ -7,7 +7,8 @@ from backend.modules.game import Game
 from backend.modules.leaderboard import Leaderboard
 from backend.modules.settings import Settings
 
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QMessageBox, QMainWindow
+from PyQt6.QtCore import QTimer
 
 import sys
 
@@ -19,6 +20,12 @@ class Menu(MenuInterface, BasicWindowFunctionality):
     backend функционал. Осуществляет связь между всеми разделами игры
     """
 
+    # порядок, в котором разделы создаются заранее: сначала самые тяжелые
+    chapters_order = (Game, Leaderboard, Settings, Achievements, Authors)
+
+    # задержка перед разогревом разделов (мс), чтобы меню успело отрисоваться
+    warm_up_delay = 200
+
     def __init__(self):
         # 1. Перезапускам классы родителей и передаем параметры
         MenuInterface.__init__(self)
@@ -35,71 +42,89 @@ class Menu(MenuInterface, BasicWindowFunctionality):
         }
         self.connect_buttons_and_funcs(buttons)
 
+        # 3. Созданные разделы переиспользуются. Словарь в формате: {класс_раздела: окно_раздела}
+        self.chapters = {}
 
-    def open_settings_chapter(self) -> None:
+        # 4. Если включено в конфиге, после появления меню заранее создаем разделы в фоне
+        if self.config.frontend.other_frontend.warm_up_chapters:
+            QTimer.singleShot(self.warm_up_delay, self.warm_up_chapters)
+
+
+    def get_chapter(self, chapter_class: type) -> QMainWindow:
         """
-        Метод, позволяющий открыть раздел настроек
+        Возвращает раздел указанного класса. Раздел создается при первом открытии
+        (или заранее, при разогреве), а дальше переиспользуется: вместо повторной
+        загрузки .ui файла, конфига и картинок он лишь сбрасывается методом reset_chapter
+        """
+        if chapter_class not in self.chapters:
+            self.chapters[chapter_class] = chapter_class(menu_chapter=self) # передаем ссылку на себя
+            # для возврата в главное меню и предотвращения появления дубликатов
+        else:
+            self.chapters[chapter_class].reset_chapter()
+        return self.chapters[chapter_class]
+
+
+    def open_chapter(self, chapter_class: type) -> QMainWindow:
+        """
+        Вспомогательный метод, открывающий раздел на месте главного меню
         """
         frame_geometry = self.frameGeometry()   # получаем положение окна
         frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
 
         self.hide() # скрываем, но не закрываем главное меню, чтобы не было дубликатов!
 
-        self.settings_chapter = Settings(menu_chapter=self) # создаем экземпляр окна настроек, передаем 
-        # ссылку на себя для возврата в главное меню и предотвращения появления дубликатов
-        self.settings_chapter.open_window(frame_x, frame_y) # открываем окно настроек с заданным положением
+        chapter = self.get_chapter(chapter_class)
+        chapter.open_window(frame_x, frame_y)   # открываем раздел с заданным положением
+        return chapter
 
 
-    def open_leaderboard_chapter(self) -> None:
+    def warm_up_chapters(self) -> None:
         """
-        Метод, позволяющий открыть раздел таблицы лидеров
+        Заранее создает еще не открывавшиеся разделы, чтобы первое открытие было
+        таким же быстрым, как повторное. Окна Qt можно создавать только в главном
+        потоке, поэтому за одну итерацию цикла событий создается один раздел,
+        и меню остается отзывчивым
         """
-        frame_geometry = self.frameGeometry()
-        frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
+        for chapter_class in self.chapters_order:
+            if chapter_class not in self.chapters:
+                self.chapters[chapter_class] = chapter_class(menu_chapter=self)
+                QTimer.singleShot(0, self.warm_up_chapters) # следующий раздел - на следующей итерации
+                return
+
+
+    def open_settings_chapter(self) -> None:
+        """
+        Метод, позволяющий открыть раздел настроек
+        """
+        self.settings_chapter = self.open_chapter(Settings)
 
-        self.hide() # скрываем, но не закрываем главное меню, чтобы не было дубликатов!
 
-        self.leaderboard_chapter = Leaderboard(menu_chapter=self)
-        self.leaderboard_chapter.open_window(frame_x, frame_y)
+    def open_leaderboard_chapter(self) -> None:
+        """
+        Метод, позволяющий открыть раздел таблицы лидеров
+        """
+        self.leaderboard_chapter = self.open_chapter(Leaderboard)
 
 
     def open_game_chapter(self) -> None:
         """
         Метод, позволяющий открыть раздел самой игры
         """
-        frame_geometry = self.frameGeometry()
-        frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
-
-        self.hide()
-
-        self.game_chapter = Game(menu_chapter=self)
-        self.game_chapter.open_window(frame_x, frame_y)
+        self.game_chapter = self.open_chapter(Game)
 
 
     def open_achievements_chapter(self) -> None:
         """
         Метод, позволяющий открыть раздел достижений
         """
-        frame_geometry = self.frameGeometry()
-        frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
-
-        self.hide()
-
-        self.achievements_chapter = Achievements(menu_chapter=self)
-        self.achievements_chapter.open_window(frame_x, frame_y)
+        self.achievements_chapter = self.open_chapter(Achievements)
 
 
     def open_authors_chapter(self) -> None:
         """
         Метод, позволяющий открыть раздел создателей игры
         """
-        frame_geometry = self.frameGeometry()
-        frame_x, frame_y = frame_geometry.x(), frame_geometry.y()
-
-        self.hide()
-        
-        self.authors_chapter = Authors(menu_chapter=self)
-        self.authors_chapter.open_window(frame_x, frame_y)
+        self.authors_chapter = self.open_chapter(Authors)
 
 
     def confirm_exit(self) -> None:
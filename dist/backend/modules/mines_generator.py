@@ -0,0 +1,188 @@
+from concurrent.futures import Executor, Future
+
+import random
+
+from backend.modules.board import Board
+from backend.modules.solver import is_solvable
+
+
+def opening_indexes(field_size: int, row: int, col: int) -> list[int]:
+    """
+    Возвращает индексы клетки первого хода и ее соседей (область 3×3,
+    обрезанная краями поля) в порядке возрастания
+    """
+    return [
+        r * field_size + c
+        for r in range(max(0, row - 1), min(field_size, row + 2))
+        for c in range(max(0, col - 1), min(field_size, col + 2))
+    ]
+
+
+def sample_mines(cells_count: int, count_mines: int, excluded: list[int],
+                 rng: random.Random) -> list[int]:
+    """
+    Выбирает count_mines различных индексов клеток из range(cells_count),
+    не попадающих в excluded, без построения списка всех клеток поля. При
+    небольшой плотности мин используется выборка с отклонением, при большой -
+    частичное перемешивание Фишера-Йетса, хранящее только переставленные элементы
+    """
+    excluded = sorted(excluded)
+    available = cells_count - len(excluded)
+    if not 0 <= count_mines <= available:
+        raise ValueError("count_mines must not exceed the number of available cells")
+
+    if count_mines * 2 <= available:    # выборка с отклонением: повторы редки
+        skip = set(excluded)
+        chosen = set()
+        while len(chosen) < count_mines:
+            index = rng.randrange(cells_count)
+            if index not in skip:
+                chosen.add(index)
+        return list(chosen)
+
+    # частичный Фишер-Йетс по виртуальному массиву range(available): в словаре
+    # хранятся только элементы, которые были переставлены
+    swapped = {}
+    virtual = []
+    for i in range(count_mines):
+        j = rng.randrange(i, available)
+        virtual.append(swapped.get(j, j))
+        swapped[j] = swapped.get(i, i)
+
+    # переводим виртуальные индексы в настоящие, пропуская исключенные клетки
+    indexes = []
+    for index in virtual:
+        for skipped in excluded:
+            if skipped <= index:
+                index += 1
+        indexes.append(index)
+    return indexes
+
+
+def excluded_indexes(field_size: int, count_mines: int, first_move: tuple[int, int],
+                     safe_opening: bool = True) -> list[int]:
+    """
+    Возвращает индексы клеток, в которых не должно быть мин при данном первом
+    ходе: область 3×3 вокруг него, а если для нее на поле не хватает места
+    (или safe_opening = False) - только саму клетку первого хода
+    """
+    row, col = first_move
+    excluded = opening_indexes(field_size, row, col) if safe_opening else []
+    if field_size ** 2 - len(excluded) < count_mines or not excluded:
+        excluded = [row * field_size + col]
+    return excluded
+
+
+def generate_mines(field_size: int, count_mines: int, first_move: tuple[int, int] | None = None,
+                   seed: int | None = None, safe_opening: bool = True, no_guess: bool = False,
+                   max_attempts: int = 100) -> list[int]:
+    """
+    Генерирует индексы мин для поля field_size × field_size.
+        first_move - клетка первого хода, в ней мины не будет никогда
+        seed - зерно генератора: одинаковые параметры дают одинаковое поле
+        safe_opening - не ставить мины и в соседние с первым ходом клетки, чтобы
+            первый ход открыл область (если поле слишком плотное, исключается
+            только сама клетка)
+        no_guess - генерировать поле заново, пока его нельзя будет открыть
+            без угадывания, начиная с первого хода (без first_move выбрасывается
+            ValueError). Если за max_attempts попыток такое поле не найдено,
+            выбрасывается RuntimeError
+    """
+    if no_guess and first_move is None:
+        raise ValueError("no_guess requires first_move")
+
+    rng = random.Random(seed)
+    cells_count = field_size ** 2
+
+    excluded = []
+    if first_move is not None:
+        excluded = excluded_indexes(field_size, count_mines, first_move, safe_opening)
+
+    if not no_guess:
+        return sample_mines(cells_count, count_mines, excluded, rng)
+
+    for _ in range(max_attempts):
+        indexes = sample_mines(cells_count, count_mines, excluded, rng)
+
+        board = Board(field_size, count_mines)
+        board.place_mines(indexes)
+        if is_solvable(board, *first_move):
+            return indexes
+
+    raise RuntimeError(f"no board solvable without guessing was found in {max_attempts} attempts")
+
+
+def generate_board(field_size: int, count_mines: int, seed: int | None = None) -> Board:
+    """
+    Генерирует поле с расставленными минами еще до первого хода (клетка первого
+    хода не исключается). Перед игрой мины убираются из области первого хода
+    функцией clear_opening. Подходит для заблаговременной генерации в фоне
+    """
+    board = Board(field_size, count_mines)
+    board.place_mines(generate_mines(field_size, count_mines, seed=seed))
+    return board
+
+
+def clear_opening(board: Board, first_move: tuple[int, int], safe_opening: bool = True,
+                  seed: int | None = None) -> None:
+    """
+    Переносит мины из клетки первого хода и соседних с ней клеток (см. excluded_indexes)
+    в случайные свободные клетки за их пределами. Переносится не больше 9 мин, поэтому
+    вызов во много раз быстрее генерации поля, а получившееся поле распределено так же
+    равномерно, как сгенерированное generate_mines с тем же первым ходом
+    """
+    rng = random.Random(seed)
+    excluded = excluded_indexes(board.field_size, board.count_mines, first_move, safe_opening)
+    skip = set(excluded)
+
+    for index in excluded:
+        if board.mines[index]:
+            board.move_mine(index, free_cell(board, skip, rng))
+
+
+def free_cell(board: Board, skip: set[int], rng: random.Random) -> int:
+    """
+    Вспомогательная функция для clear_opening, выбирающая случайную клетку без
+    мины не из skip. Сначала пробует выборку с отклонением, а на очень плотном
+    поле выбирает из списка всех подходящих клеток
+    """
+    for _ in range(32):
+        index = rng.randrange(board.cells_count)
+        if not board.mines[index] and index not in skip:
+            return index
+
+    return rng.choice([
+        index for index in range(board.cells_count)
+        if not board.mines[index] and index not in skip
+    ])
+
+
+def prefetch_batch(executor: Executor, field_size: int, count_mines: int, count: int,
+                   seeds: list[int | None] | None = None) -> list[Future]:
+    """
+    Ставит генерацию count полей (generate_board) в очередь executor
+    (ThreadPoolExecutor или ProcessPoolExecutor) и сразу возвращает Future
+    с готовыми полями. Первый ход для этого знать не нужно: когда игрок
+    сделает его, мины убираются из его области функцией clear_opening
+    """
+    if seeds is None:
+        seeds = [None] * count
+
+    return [executor.submit(generate_board, field_size, count_mines, seed) for seed in seeds]
+
+
+def generate_batch(field_size: int, count_mines: int, count: int,
+                   seeds: list[int | None] | None = None,
+                   executor: Executor | None = None) -> list[Board]:
+    """
+    Генерирует count полей и дожидается результата. Без executor поля
+    генерируются в текущем потоке
+    """
+    if seeds is None:
+        seeds = [None] * count
+
+    if executor is None:
+        return [generate_board(field_size, count_mines, seed) for seed in seeds]
+
+    futures = prefetch_batch(executor, field_size, count_mines, count, seeds)
+    return [future.result() for future in futures]
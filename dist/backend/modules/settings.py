@@ -1,11 +1,11 @@
 from frontend.chapters.settings_interface import SettingsInterface
 
 from backend.modules.basic_window_of_functionality import BasicWindowFunctionality
+from backend.modules.storage import get_storage
 
-import sqlite3
+from frontend.resources import get_icon
 
 from PyQt6.QtWidgets import QButtonGroup, QRadioButton, QMainWindow
-from PyQt6.QtGui import QIcon
 from typing import Callable
 
 
@@ -61,6 +61,14 @@ class Settings(SettingsInterface, BasicWindowFunctionality):
         self.load_settings()
 
 
+    def reset_chapter(self) -> None:
+        """
+        Перед повторным открытием раздела заново загружает сохраненные
+        настройки, отбрасывая несохраненный выбор
+        """
+        self.load_settings()
+
+
     def load_settings(self) -> None:
         """
         Метод, координирующий загрузку настроек пользователя. Получает данные и
@@ -75,22 +83,7 @@ class Settings(SettingsInterface, BasicWindowFunctionality):
         Вспомогательный метод для load_settings, осуществляющий загрузку
         настроек пользователя
         """
-        con = sqlite3.connect(self.config.backend.data.storage)
-        cur = con.cursor()
-
-        data = cur.execute(
-            '''
-            SELECT
-                game_difficulty, game_mode, clue
-            FROM
-                settings
-            WHERE
-                key = 0
-            '''
-        ).fetchall()
-        con.close()
-
-        return data[0]
+        return get_storage(self.config.backend.data.storage).load_settings()
 
 
     def arrange_checkboxes(self, data: list) -> None:
@@ -121,9 +114,9 @@ class Settings(SettingsInterface, BasicWindowFunctionality):
         checked_button = group.checkedButton()
         for button in group.buttons():
             if button == checked_button: # если кнопка выбрана
-                button.setIcon(QIcon(self.config.frontend.radio_buttons.selected_dot))
+                button.setIcon(get_icon(self.config.frontend.radio_buttons.selected_dot))
             else:
-                button.setIcon(QIcon(self.config.frontend.radio_buttons.not_selected_dot))
+                button.setIcon(get_icon(self.config.frontend.radio_buttons.not_selected_dot))
 
 
     def radio_button_toggled(self) -> None:
@@ -137,11 +130,11 @@ class Settings(SettingsInterface, BasicWindowFunctionality):
         other = [button for button in sender.group().buttons() if sender != button][0]
 
         if sender.isChecked():
-            sender.setIcon(QIcon(self.config.frontend.radio_buttons.selected_dot))
-            other.setIcon(QIcon(self.config.frontend.radio_buttons.not_selected_dot))
+            sender.setIcon(get_icon(self.config.frontend.radio_buttons.selected_dot))
+            other.setIcon(get_icon(self.config.frontend.radio_buttons.not_selected_dot))
         else:
-            other.setIcon(QIcon(self.config.frontend.radio_buttons.selected_dot))
-            sender.setIcon(QIcon(self.config.frontend.radio_buttons.not_selected_dot))
+            other.setIcon(get_icon(self.config.frontend.radio_buttons.selected_dot))
+            sender.setIcon(get_icon(self.config.frontend.radio_buttons.not_selected_dot))
 
 
     def save_settings(self) -> None:
@@ -169,23 +162,7 @@ class Settings(SettingsInterface, BasicWindowFunctionality):
         Вспомогательный метод для save_settings, осуществляющий
         загрузку в базу данных настроек пользователя
         """
-        con = sqlite3.connect(self.config.backend.data.storage)
-        cur = con.cursor()
-
-        cur.execute(
-            '''
-            UPDATE
-                settings
-            SET
-                game_difficulty = ?,
-                game_mode = ?,
-                clue = ?
-            WHERE
-                key = 0
-            ''', data
-        )
-        con.commit()
-        con.close()
+        get_storage(self.config.backend.data.storage).upload_settings(data)
 
 
     @staticmethod
@@ -0,0 +1,585 @@
+from collections import Counter
+from functools import lru_cache
+
+import argparse
+import json
+import math
+import time
+
+from backend.modules.board import Board
+
+
+# уровни правил, которыми решатель находит новые клетки, от простых к сложным
+SINGLE, PAIR, ENUMERATION = "single", "pair", "enumeration"
+
+# компоненты с большим количеством клеток не перебираются (слишком долго)
+MAX_COMPONENT_CELLS = 48
+
+# перебор компоненты прерывается после стольких шагов: при слабых ограничениях
+# количество расстановок растет экспоненциально даже в небольшой компоненте
+MAX_ENUMERATION_NODES = 50000
+
+
+class Solver:
+    """
+    Реализует решатель поля: по открытым клеткам и их цифрам находит клетки,
+    которые гарантированно безопасны или гарантированно заняты минами, а также
+    вероятность мины в остальных закрытых клетках. Расположение мин решатель
+    не видит - он использует только то, что видно игроку.
+
+    Решатель работает инкрементально: после каждого хода в него передаются
+    открытые клетки (update), и правила применяются только к той части границы
+    (открытых цифр с закрытыми соседями), которую затронул ход. Правила:
+        1. single - правила одной цифры
+        2. pair - правила пары цифр (в том числе вложенных множеств соседей)
+        3. enumeration - перебор расстановок мин в связных компонентах границы
+           с учетом общего количества мин; результаты перебора кэшируются
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.size = board.field_size
+
+        self.mines = bytearray(board.cells_count)  # найденные мины
+        self.mines_count = 0
+        self.safe = set()   # найденные безопасные, но еще не открытые клетки
+
+        # открытые цифры, у которых есть закрытые соседи с неизвестным состоянием
+        self.frontier = set()
+
+        # цифры, изменившиеся с последнего применения правил одной цифры и правил пары
+        self.dirty, self.pair_dirty = set(), set()
+
+        # вероятности мин, посчитанные последним перебором
+        self.probabilities, self.outside_probability = {}, None
+
+        # списки соседей цифр границы и найденных клеток в формате: {индекс_клетки: индексы_соседей}
+        self.neighbours_cache = {}
+
+        # сдвиги индексов соседей клетки, не лежащей на краю поля
+        size = self.size
+        self.offsets = (-size - 1, -size, -size + 1, -1, 1, size - 1, size, size + 1)
+
+        # открываем в решателе уже открытые на поле клетки
+        self.update([board.position(index) for index in range(board.cells_count) if board.revealed[index]])
+
+
+    def neighbours(self, index: int) -> list[int]:
+        """
+        Возвращает индексы соседних клеток. Списки соседей кэшируются только
+        для клеток, которые понадобились правилам (цифры границы и найденные клетки),
+        а не для всех открытых клеток
+        """
+        neighbours = self.neighbours_cache.get(index)
+        if neighbours is None:
+            neighbours = self.neighbours_cache[index] = self.around(index)
+        return neighbours
+
+
+    def around(self, index: int) -> list[int]:
+        """
+        Вычисляет индексы соседних клеток без кэша. Для клеток не на краю
+        поля соседи получаются сдвигом индекса
+        """
+        size = self.size
+        row, col = divmod(index, size)
+        if 0 < row < size - 1 and 0 < col < size - 1:
+            return [index + offset for offset in self.offsets]
+
+        return [
+            r * size + c
+            for r in range(max(0, row - 1), min(size, row + 2))
+            for c in range(max(0, col - 1), min(size, col + 2))
+            if r != row or c != col
+        ]
+
+
+    def update(self, cells: list[tuple[int, int]]) -> None:
+        """
+        Сообщает решателю об открытых клетках. Отмечает измененными сами
+        клетки и открытых соседей (у них стало меньше закрытых клеток). Соседи
+        обходятся без кэша: большая часть открытых клеток лежит внутри открытой
+        области и правилам не понадобится
+        """
+        revealed, adjacent, size = self.board.revealed, self.board.adjacent, self.size
+        changed = set()
+
+        for row, col in cells:
+            index = row * size + col
+            self.safe.discard(index)
+            if adjacent[index]:     # сама клетка
+                changed.add(index)
+            for neighbour in self.around(index):    # и ее открытые соседи-цифры
+                if adjacent[neighbour] and revealed[neighbour]:
+                    changed.add(neighbour)
+
+        self.frontier |= changed
+        self.dirty |= changed
+        self.pair_dirty |= changed
+
+        self.probabilities, self.outside_probability = {}, None
+
+
+    def constraint(self, index: int) -> tuple[frozenset, int]:
+        """
+        Возвращает ограничение открытой цифры: множество соседей с неизвестным
+        состоянием и количество мин, которое среди них осталось найти
+        """
+        revealed, mines = self.board.revealed, self.mines
+        unknown, remaining = [], self.board.adjacent[index]
+
+        for neighbour in self.neighbours(index):
+            if mines[neighbour]:
+                remaining -= 1
+            elif not revealed[neighbour] and neighbour not in self.safe:
+                unknown.append(neighbour)
+
+        return frozenset(unknown), remaining
+
+
+    def mark(self, safe: set[int], mines: set[int]) -> bool:
+        """
+        Запоминает найденные безопасные клетки и мины. Открытые соседи этих
+        клеток становятся измененными. Возвращает True, если найдено что-то новое
+        """
+        safe = safe - self.safe
+        mines = {index for index in mines if not self.mines[index]}
+
+        self.safe.update(safe)
+        for index in mines:
+            self.mines[index] = 1
+        self.mines_count += len(mines)
+
+        # открытые соседи-цифры найденных клеток становятся измененными
+        revealed, adjacent = self.board.revealed, self.board.adjacent
+        changed = {
+            neighbour for index in safe | mines for neighbour in self.neighbours(index)
+            if adjacent[neighbour] and revealed[neighbour]
+        }
+        self.frontier |= changed
+        self.dirty |= changed
+        self.pair_dirty |= changed
+
+        return bool(safe or mines)
+
+
+    def apply_single_rules(self) -> bool:
+        """
+        Правила одной цифры: если все мины вокруг найдены, остальные соседи
+        безопасны, а если неизвестных соседей столько же, сколько осталось мин,
+        все они - мины. Применяются, пока есть измененные цифры
+        """
+        progress = False
+
+        while self.dirty:
+            index = self.dirty.pop()
+            unknown, remaining = self.constraint(index)
+
+            if not unknown:     # у цифры не осталось неизвестных соседей
+                self.frontier.discard(index)
+                self.neighbours_cache.pop(index, None)
+            elif remaining == 0:
+                progress |= self.mark(set(unknown), set())
+            elif remaining == len(unknown):
+                progress |= self.mark(set(), set(unknown))
+
+        return progress
+
+
+    def apply_pair_rules(self) -> bool:
+        """
+        Правила пары цифр на расстоянии не больше двух клеток. Если разность
+        оставшихся мин равна количеству клеток, принадлежащих только одной из
+        цифр, то все эти клетки - мины, а клетки только другой цифры безопасны
+        """
+        safe, mines = set(), set()
+        size = self.size
+        constraints = {}    # ограничения цифр, уже посчитанные в этом проходе
+
+        for a in self.pair_dirty & self.frontier:
+            if a not in constraints:
+                constraints[a] = self.constraint(a)
+            unknown_a, remaining_a = constraints[a]
+            row, col = divmod(a, size)
+
+            for r in range(max(0, row - 2), min(size, row + 3)):
+                for c in range(max(0, col - 2), min(size, col + 3)):
+                    b = r * size + c
+                    if b == a or b not in self.frontier:
+                        continue
+
+                    if b not in constraints:
+                        constraints[b] = self.constraint(b)
+                    unknown_b, remaining_b = constraints[b]
+                    only_a, only_b = unknown_a - unknown_b, unknown_b - unknown_a
+
+                    # правило симметрично, поэтому проверяется в обе стороны
+                    if remaining_b - remaining_a == len(only_b):
+                        mines |= only_b
+                        safe |= only_a
+                    if remaining_a - remaining_b == len(only_a):
+                        mines |= only_a
+                        safe |= only_b
+
+        self.pair_dirty.clear()
+        return self.mark(safe, mines)
+
+
+    def components(self) -> list[tuple]:
+        """
+        Делит границу на связные компоненты: цифры, у которых есть общие
+        неизвестные соседи, попадают в одну компоненту. Каждая компонента -
+        отсортированный кортеж ограничений (неизвестные клетки, оставшиеся мины)
+        """
+        constraints = {}
+        owners = {}     # в формате: {неизвестная клетка: [цифры, которым она соседняя]}
+        for index in self.frontier:
+            unknown, remaining = self.constraint(index)
+            if unknown:
+                constraints[index] = (tuple(sorted(unknown)), remaining)
+                for cell in unknown:
+                    owners.setdefault(cell, []).append(index)
+
+        components, visited = [], set()
+        for start in constraints:
+            if start in visited:
+                continue
+
+            visited.add(start)
+            stack, component = [start], set()
+            while stack:
+                index = stack.pop()
+                component.add(constraints[index])
+                for cell in constraints[index][0]:
+                    for other in owners[cell]:
+                        if other not in visited:
+                            visited.add(other)
+                            stack.append(other)
+
+            components.append(tuple(sorted(component)))
+
+        return components
+
+
+    def apply_enumeration(self) -> bool:
+        """
+        Перебирает все допустимые расстановки мин в каждой компоненте границы
+        и, учитывая общее количество мин на поле, находит клетки, которые
+        безопасны (или заняты миной) во всех расстановках. Попутно считает
+        вероятность мины для каждой неизвестной клетки
+        """
+        board = self.board
+        enumerated, skipped = [], 0
+        for component in self.components():
+            result = enumerate_component(component)
+            if result is None:  # компонента слишком велика или перебор слишком долог
+                skipped += 1
+            else:
+                enumerated.append(result)
+
+        # количество мин в каждой компоненте в формате: {количество_мин: количество_расстановок}
+        distributions = [{count: ways for count, (ways, _) in solutions.items()} for _, solutions in enumerated]
+        in_components = sum(len(cells) for cells, _ in enumerated)
+
+        # закрытые клетки с неизвестным состоянием, не соседние ни с одной цифрой
+        hidden = board.cells_count - board.revealed_count - self.mines_count - len(self.safe)
+        outside = hidden - in_components
+        remaining = board.count_mines - self.mines_count
+
+        scale = None
+        if not skipped:     # без полного перебора общее количество мин учесть нельзя
+            totals = combine(distributions)
+            scale = log_scale(outside, [remaining - total for total in totals])
+
+        safe, mines = set(), set()
+        self.probabilities = {}
+
+        for position, (cells, solutions) in enumerate(enumerated):
+            others = combine(distributions[:position] + distributions[position + 1:])
+            weights = {count: weight(others, count, outside, remaining, scale) for count in solutions}
+            feasible = [solutions[count] for count in solutions if weights[count] > 0]
+            total = sum(ways * weights[count] for count, (ways, _) in solutions.items())
+            if not total:
+                continue
+
+            for i, cell in enumerate(cells):
+                if all(counts[i] == 0 for _, counts in feasible):
+                    safe.add(cell)
+                elif all(counts[i] == ways for ways, counts in feasible):
+                    mines.add(cell)
+
+                self.probabilities[cell] = sum(
+                    counts[i] * weights[count] for count, (_, counts) in solutions.items()
+                ) / total
+
+        # вероятность мины в клетках, не соседних ни с одной цифрой
+        self.outside_probability = None
+        if outside > 0 and scale is not None:
+            weights = {total: weight({0: ways}, total, outside, remaining, scale) for total, ways in totals.items()}
+            feasible = [total for total in totals if weights[total] > 0]
+            if feasible:
+                expected = sum(weights[total] * (remaining - total) for total in feasible) / sum(weights.values())
+                self.outside_probability = expected / outside
+
+                # если во всех расстановках вне границы нет мин (или мины везде), клетки определены
+                if all(remaining - total in (0, outside) for total in feasible) and \
+                        len({remaining - total for total in feasible}) == 1:
+                    determined = {
+                        index for index in range(board.cells_count)
+                        if not board.revealed[index] and not self.mines[index]
+                        and index not in self.safe and index not in self.probabilities
+                    }
+                    (safe if remaining == feasible[0] else mines).update(determined)
+
+        return self.mark(safe, mines)
+
+
+    def step(self) -> str | None:
+        """
+        Применяет правила от простых к сложным до первого, которое нашло
+        что-то новое. Возвращает уровень этого правила или None
+        """
+        if self.apply_single_rules():
+            return SINGLE
+        if self.apply_pair_rules():
+            return PAIR
+        if self.apply_enumeration():
+            return ENUMERATION
+        return None
+
+
+    def find_safe_cells(self) -> tuple[set[int], list[str]]:
+        """
+        Применяет правила, пока не будет найдена хотя бы одна безопасная
+        клетка или пока правила не перестанут давать результат. Возвращает
+        безопасные клетки и список уровней примененных правил
+        """
+        levels = []
+        while not self.safe:
+            level = self.step()
+            if level is None:
+                break
+            levels.append(level)
+        return self.safe, levels
+
+
+    def probability(self, row: int, col: int) -> float | None:
+        """
+        Возвращает вероятность мины в клетке по результатам последнего
+        перебора (None, если она неизвестна)
+        """
+        index = row * self.size + col
+        if self.mines[index]:
+            return 1.0
+        if index in self.safe or self.board.revealed[index]:
+            return 0.0
+        return self.probabilities.get(index, self.outside_probability)
+
+
+def enumerate_component(component: tuple) -> tuple[tuple, dict] | None:
+    """
+    Перебирает все расстановки мин, удовлетворяющие ограничениям компоненты.
+    Возвращает клетки компоненты и словарь в формате:
+    {количество_мин: (количество_расстановок, количество_расстановок_с_миной_в_каждой_клетке)}
+    Результат кэшируется: компоненты, которых ход не коснулся, повторно не перебираются
+    """
+    cells = tuple(sorted({cell for unknown, _ in component for cell in unknown}))
+    if len(cells) > MAX_COMPONENT_CELLS:
+        return None
+
+    solutions = enumerate_cells(cells, component)
+    if solutions is None:   # перебор не уложился в MAX_ENUMERATION_NODES шагов
+        return None
+    return cells, solutions
+
+
+@lru_cache(maxsize=4096)
+def enumerate_cells(cells: tuple, component: tuple) -> dict | None:
+    """
+    Вспомогательная функция для enumerate_component: перебор с возвратом
+    с отсечением по каждому ограничению. Возвращает None, если перебор
+    превысил MAX_ENUMERATION_NODES шагов
+    """
+    position = {cell: i for i, cell in enumerate(cells)}
+    constraints = [([position[cell] for cell in unknown], remaining) for unknown, remaining in component]
+
+    # для каждой клетки - ограничения, в которые она входит
+    cell_constraints = [[] for _ in cells]
+    for i, (members, _) in enumerate(constraints):
+        for member in members:
+            cell_constraints[member].append(i)
+
+    placed = [0] * len(constraints)     # мин уже поставлено в каждом ограничении
+    left = [len(members) for members, _ in constraints]     # не решенных клеток в ограничении
+    assignment = [0] * len(cells)
+    solutions = {}
+    budget = [MAX_ENUMERATION_NODES]   # сколько шагов перебора еще осталось
+
+    def backtrack(i: int, mines: int) -> bool:
+        budget[0] -= 1
+        if budget[0] < 0:
+            return False
+
+        if i == len(cells):
+            ways, counts = solutions.get(mines, (0, [0] * len(cells)))
+            solutions[mines] = (ways + 1, [count + value for count, value in zip(counts, assignment)])
+            return True
+
+        for value in (0, 1):
+            valid = True
+            for c in cell_constraints[i]:
+                placed[c] += value
+                left[c] -= 1
+                remaining = constraints[c][1]
+                if placed[c] > remaining or placed[c] + left[c] < remaining:
+                    valid = False
+
+            finished = True
+            if valid:
+                assignment[i] = value
+                finished = backtrack(i + 1, mines + value)
+
+            for c in cell_constraints[i]:
+                placed[c] -= value
+                left[c] += 1
+
+            if not finished:
+                return False
+
+        assignment[i] = 0
+        return True
+
+    if not backtrack(0, 0):
+        return None
+    return {mines: (ways, tuple(counts)) for mines, (ways, counts) in solutions.items()}
+
+
+def combine(distributions: list[dict[int, int]]) -> dict[int, int]:
+    """
+    Складывает независимые компоненты: возвращает количество расстановок
+    для каждого общего количества мин
+    """
+    result = {0: 1}
+    for distribution in distributions:
+        merged = {}
+        for total, ways in result.items():
+            for count, count_ways in distribution.items():
+                merged[total + count] = merged.get(total + count, 0) + ways * count_ways
+        result = merged
+    return result
+
+
+def log_comb(n: int, k: int) -> float:
+    """
+    Логарифм биномиального коэффициента (без огромных целых чисел на больших полях)
+    """
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def log_scale(outside: int, rests: list[int]) -> float | None:
+    """
+    Возвращает наибольший логарифм количества способов разместить оставшиеся
+    мины вне границы. Веса считаются относительно него, чтобы не выйти за
+    пределы float
+    """
+    logs = [log_comb(outside, rest) for rest in rests if 0 <= rest <= outside]
+    return max(logs) if logs else None
+
+
+def weight(others: dict[int, int], count: int, outside: int, remaining: int, scale: float | None) -> float:
+    """
+    Возвращает относительный вес расстановок с count минами в компоненте:
+    сумму по остальным компонентам количества их расстановок, умноженного на
+    количество способов разместить оставшиеся мины в клетках вне границы.
+    Если scale равен None, общее количество мин не учитывается
+    """
+    if scale is None:
+        return 1.0
+
+    total = 0.0
+    for other_count, ways in others.items():
+        rest = remaining - count - other_count
+        if 0 <= rest <= outside:
+            total += ways * math.exp(log_comb(outside, rest) - scale)
+    return total
+
+
+def solve_board(board: Board, row: int, col: int) -> dict:
+    """
+    Пытается открыть все поле без угадывания, начиная с клетки (row, col).
+    Возвращает словарь с результатом: solved - открыто ли поле, levels -
+    сколько раз применялось правило каждого уровня. Состояние поля изменяется
+    """
+    levels = Counter()
+    if board.is_mine(row, col):
+        return {"solved": False, "levels": levels}
+
+    solver = Solver(board)
+    solver.update(board.reveal_area(row, col))
+
+    while not board.is_cleared():
+        safe, used = solver.find_safe_cells()
+        levels.update(used)
+        if not safe:
+            break
+
+        opened = []
+        for index in list(safe):
+            opened.extend(board.reveal_area(*board.position(index)))
+        solver.update(opened)
+
+    return {"solved": board.is_cleared(), "levels": levels}
+
+
+def is_solvable(board: Board, row: int, col: int) -> bool:
+    """
+    Проверяет, можно ли открыть все поле без угадывания, начиная с клетки
+    (row, col). Состояние поля после проверки изменено
+    """
+    return solve_board(board, row, col)["solved"]
+
+
+def main(arguments: list[str] | None = None) -> dict:
+    """
+    Консольный интерфейс решателя: генерирует поля и решает их, выводя долю
+    решенных без угадывания полей, распределение сложности (самый сложный
+    понадобившийся уровень правил) и скорость решения
+    """
+    from backend.modules.mines_generator import generate_mines
+
+    parser = argparse.ArgumentParser(description="Minesweeper board solver")
+    parser.add_argument("--size", type=int, default=16, help="field size (cells per side)")
+    parser.add_argument("--mines", type=int, default=40, help="number of mines")
+    parser.add_argument("--boards", type=int, default=1000, help="number of boards to solve")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first board")
+    options = parser.parse_args(arguments)
+
+    first_move = (options.size // 2, options.size // 2)
+    difficulty = Counter()
+    solved = 0
+
+    start = time.perf_counter()
+    for seed in range(options.seed, options.seed + options.boards):
+        board = Board(options.size, options.mines)
+        board.place_mines(generate_mines(options.size, options.mines, first_move, seed=seed))
+        result = solve_board(board, *first_move)
+
+        solved += result["solved"]
+        hardest = max(result["levels"], key=[SINGLE, PAIR, ENUMERATION].index, default=SINGLE)
+        difficulty[hardest if result["solved"] else "guess"] += 1
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "size": options.size,
+        "mines": options.mines,
+        "boards": options.boards,
+        "solved": solved,
+        "difficulty": dict(difficulty),
+        "boards_per_second": options.boards / elapsed if elapsed else None
+    }
+    print(json.dumps(report, indent=4))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import atexit
+import sqlite3
+import threading
+
+
+class Storage:
+    """
+    Реализует доступ к базе данных storage.sqlite. В отличие от открытия нового
+    соединения на каждый запрос, держит одно соединение на все время работы игры
+    в режиме WAL, при первом подключении приводит таблицу leaders к числовому
+    столбцу time и создает индекс (field_size, time) для быстрой выборки лидеров.
+    Запросы могут выполняться из фоновых потоков: доступ к соединению
+    защищен блокировкой
+    """
+
+    # версия схемы базы, до которой ее приводит migrate
+    schema_version = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+
+        # WAL позволяет читать базу во время записи, а synchronous = NORMAL
+        # избавляет от fsync на каждую транзакцию (в WAL это безопасно)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+
+        self.migrate()
+
+
+    def migrate(self) -> None:
+        """
+        Приводит схему базы к актуальной: создает недостающие таблицы, делает
+        столбец time числовым и создает индекс для выборки лидеров по уровню сложности.
+        Версия схемы записывается в PRAGMA user_version, поэтому миграция выполняется
+        один раз, а при следующих запусках проверяется только номер версии
+        """
+        user_version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if user_version >= self.schema_version:
+            return
+
+        with self.connection:
+            self.connection.execute(
+                """
+            CREATE TABLE IF NOT EXISTS leaders (
+                nickname TEXT,
+                time INTEGER,
+                field_size TEXT
+            )
+            """
+            )
+            self.connection.execute(
+                """
+            CREATE TABLE IF NOT EXISTS settings (
+                key INTEGER,
+                game_difficulty TEXT,
+                game_mode TEXT,
+                clue TEXT
+            )
+            """
+            )
+            self.connection.execute(    # настройки по умолчанию, если их еще нет
+                """
+            INSERT INTO
+                settings (key, game_difficulty, game_mode, clue)
+            SELECT
+                0, 'Beginner', 'Casual', 'On'
+            WHERE NOT EXISTS (
+                SELECT 1 FROM settings WHERE key = 0
+            )
+            """
+            )
+
+        columns = {row[1]: row[2] for row in self.connection.execute("PRAGMA table_info(leaders)")}
+
+        # пересоздаем таблицу с числовым time (значения, записанные раньше строками,
+        # приводятся к числам при переносе), создаем индекс и записываем версию
+        # схемы одной транзакцией внутри скрипта
+        rebuild = """
+            ALTER TABLE leaders RENAME TO leaders_old;
+            CREATE TABLE leaders (
+                nickname TEXT,
+                time INTEGER,
+                field_size TEXT
+            );
+            INSERT INTO leaders (nickname, time, field_size)
+                SELECT nickname, CAST(time AS INTEGER), field_size FROM leaders_old;
+            DROP TABLE leaders_old;
+            """
+        self.connection.executescript(
+            f"""
+            BEGIN;
+            {rebuild if columns["time"].upper() != "INTEGER" else ""}
+            CREATE INDEX IF NOT EXISTS
+                leaders_field_size_time
+            ON
+                leaders (field_size, time);
+            PRAGMA user_version = {self.schema_version};
+            COMMIT;
+            """
+        )
+
+
+    def load_leaders(self, field_size: str) -> list[tuple[str, int]]:
+        """
+        Возвращает никнеймы и время игроков на указанном уровне сложности,
+        отсортированные по времени
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+            SELECT
+                nickname, time
+            FROM
+                leaders
+            WHERE
+                field_size = ?
+            ORDER BY
+                time
+            """,
+                (field_size, )
+            ).fetchall()
+
+
+    def load_leaders_page(self, field_size: str, after: tuple[int, int] | None,
+                          limit: int) -> list[tuple[int, int, str]]:
+        """
+        Возвращает следующую страницу таблицы лидеров на указанном уровне
+        сложности: не больше limit записей (время, rowid, никнейм), идущих после
+        записи с ключом after = (время, rowid). Выборка идет по индексу и не
+        зависит от количества записей перед страницей
+        """
+        if after is None:   # первая страница
+            after = (-1, -1)
+
+        with self.lock:
+            return self.connection.execute(
+                """
+            SELECT
+                time, rowid, nickname
+            FROM
+                leaders
+            WHERE
+                field_size = ? AND (time, rowid) > (?, ?)
+            ORDER BY
+                time, rowid
+            LIMIT ?
+            """,
+                (field_size, *after, limit)
+            ).fetchall()
+
+
+    def record_result(self, nickname: str, time: int, field_size: str) -> None:
+        """
+        Вносит в таблицу лидеров результат одной игры
+        """
+        self.record_results([(nickname, time, field_size)])
+
+
+    def record_results(self, results: list[tuple[str, int, str]]) -> None:
+        """
+        Вносит в таблицу лидеров результаты нескольких игр одной транзакцией.
+        Каждый результат - кортеж (никнейм, время, уровень сложности)
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                """
+            INSERT INTO
+                leaders (nickname, time, field_size)
+            VALUES
+                (?, ?, ?)
+            """,
+                results
+            )
+
+
+    def load_settings(self) -> tuple[str, str, str]:
+        """
+        Возвращает настройки пользователя: уровень сложности, режим игры,
+        с подсказками или без
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+            SELECT
+                game_difficulty, game_mode, clue
+            FROM
+                settings
+            WHERE
+                key = 0
+            """
+            ).fetchone()
+
+
+    def upload_settings(self, data: tuple[str, str, str]) -> None:
+        """
+        Сохраняет настройки пользователя
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+            UPDATE
+                settings
+            SET
+                game_difficulty = ?,
+                game_mode = ?,
+                clue = ?
+            WHERE
+                key = 0
+            """,
+                data
+            )
+
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой
+        """
+        with self.lock:
+            self.connection.close()
+
+
+# открытые хранилища в формате: {путь_до_базы: Storage}
+storages = {}
+storages_lock = threading.Lock()
+
+
+def get_storage(path: str) -> Storage:
+    """
+    Возвращает общее для всей игры хранилище для указанной базы, при первом
+    вызове открывая соединение. Соединение закрывается при выходе из игры
+    """
+    with storages_lock:    # хранилище может впервые запрашиваться из фонового потока
+        if path not in storages:
+            storages[path] = Storage(path)
+            atexit.register(storages[path].close)
+        return storages[path]
@@ -0,0 +1,503 @@
+"""
+Бенчмарк игровой логики и хранилищ без запуска окна игры. Запуск из папки dist:
+
+    python -m benchmarks.benchmark --output bench.json
+
+Игры прогоняются через класс Game на платформе Qt offscreen, а с флагом
+--no-qt (или без установленного PyQt6) - напрямую через Board. Кроме игр,
+замеряются запросы к таблице лидеров и запись достижений на сгенерированных
+данных. Результат - JSON с перцентилями задержек каждой операции, пиковой
+памятью объектов Python, приростом и максимумом памяти процесса (включая Qt)
+и количеством игр в секунду, который удобно сравнивать между коммитами
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+# бенчмарк работает из папки dist: пути в data.json относительные
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend.modules.achievements_store import AchievementsStore
+from backend.modules.board import Board
+from backend.modules.mines_generator import generate_mines
+from backend.modules.solver import Solver
+from backend.modules.storage import Storage
+
+from data import load_config
+
+
+class Recorder:
+    """
+    Собирает длительности операций в формате: {название_операции: [секунды]}
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+
+    @contextmanager
+    def measure(self, operation: str):
+        """
+        Замеряет длительность блока with
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[operation].append(time.perf_counter() - start)
+
+
+    def wrap(self, operation: str, func):
+        """
+        Возвращает функцию, замеряющую каждый вызов func
+        """
+        def timed(*args, **kwargs):
+            with self.measure(operation):
+                return func(*args, **kwargs)
+        return timed
+
+
+    def summary(self) -> dict:
+        """
+        Возвращает перцентили задержек каждой операции в миллисекундах
+        """
+        return {operation: percentiles(values) for operation, values in sorted(self.samples.items())}
+
+
+def percentiles(values: list[float]) -> dict:
+    """
+    Считает количество замеров, p50, p90, p99, максимум и сумму (в миллисекундах)
+    """
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "p50_ms": rank(0.50),
+        "p90_ms": rank(0.90),
+        "p99_ms": rank(0.99),
+        "max_ms": ordered[-1] * 1000,
+        "total_ms": sum(ordered) * 1000
+    }
+
+
+def choose_cell(board: Board, solver: Solver | None, player: str, rng: random.Random) -> tuple[int, int]:
+    """
+    Выбирает следующий ход. Игрок scripted открывает доказуемо безопасные клетки
+    (а если их нет - случайную клетку, не являющуюся доказанной миной), игрок
+    random открывает случайную закрытую клетку
+    """
+    if player == "scripted":
+        safe, _ = solver.find_safe_cells()
+        if safe:
+            return board.position(min(safe))
+
+    while True:
+        index = rng.randrange(board.cells_count)
+        if not board.revealed[index] and not board.flags[index] and not (solver is not None and solver.mines[index]):
+            return board.position(index)
+
+
+# ---------------------------------------------------------------
+
+def run_engine_games(field_size: int, count_mines: int, player: str, games: int, seed: int) -> dict:
+    """
+    Прогоняет игры через Board без Qt. Операции называются так же, как
+    соответствующие методы Game, чтобы результаты можно было сравнивать
+    """
+    recorder = Recorder()
+    rng = random.Random(seed)
+    first_move = (field_size // 2, field_size // 2)
+
+    def play(_, game_seed: int) -> None:
+        board = Board(field_size, count_mines)
+        with recorder.measure("initialize_mines"):
+            board.place_mines(generate_mines(field_size, count_mines, first_move, seed=game_seed))
+        # как и в Game, решатель не участвует в ходе: он нужен только игроку scripted
+        solver = Solver(board) if player == "scripted" else None
+
+        cell = first_move
+        while True:
+            with recorder.measure("on_button_click"):
+                if board.is_mine(*cell):
+                    break
+                cells = board.reveal_area(*cell)
+            if solver is not None:
+                solver.update(cells)
+            with recorder.measure("check_is_game_finished"):
+                finished = board.is_cleared()
+            if finished:
+                break
+            cell = choose_cell(board, solver, player, rng)
+
+        for _ in range(min(1000, board.cells_count)):
+            row, col = rng.randrange(field_size), rng.randrange(field_size)
+            with recorder.measure("count_adjacent_mines"):
+                board.adjacent_mines(row, col)
+
+    return run_games(lambda: None, play, recorder, games, seed)
+
+
+def run_qt_games(field_size: int, count_mines: int, player: str, games: int, seed: int,
+                 field_mode: str) -> dict:
+    """
+    Прогоняет игры через класс Game (окно создается, но не показывается)
+    """
+    from backend.modules.game import Game
+
+    class BenchmarkGame(Game):
+        """
+        Game с заданными размером поля и режимом отрисовки, не читающий
+        настройки игрока из базы
+        """
+
+        def get_player_settings(self) -> dict:
+            return {"difficulty": "Custom", "mode": "Casual", "clue": "On"}
+
+        def get_field_size_and_count_mines(self) -> tuple[int, int]:
+            return field_size, count_mines
+
+        def load_cell_parameters(self) -> None:
+            shift = max(1, 400 // field_size)   # поле любого размера помещается в окно
+            self.width, self.height, self.shift = shift, shift, shift
+            self.x, self.y = 50, 50
+            self.start_x = self.x
+            self.font_family = self.config.backend.game_parameters.font_settings.font_family
+            self.font_size = self.config.backend.game_parameters.font_settings.font_size
+
+        def generate_field(self) -> None:
+            self.field_mode = field_mode
+            super().generate_field()
+
+    recorder = Recorder()
+    rng = random.Random(seed)
+    first_move = (field_size // 2, field_size // 2)
+
+    created = []
+
+    def create() -> BenchmarkGame:
+        with recorder.measure("create_game"):
+            game = BenchmarkGame(menu_chapter=False)
+        game.initialize_mines = recorder.wrap("initialize_mines", game.initialize_mines)
+        game.check_is_game_finished = recorder.wrap("check_is_game_finished", game.check_is_game_finished)
+        created.append(game)
+        return game
+
+    def play(game: BenchmarkGame, game_seed: int) -> None:
+        game.seed = game_seed
+        if game.prefetched_board is not None:   # поле заготовлено с другим зерном
+            game.prefetched_board.cancel()
+            game.prefetched_board = None
+
+        with recorder.measure("restart_game"):
+            game.restart_game()     # заготавливает поле с зерном этой игры
+
+        # игрок думает над первым ходом дольше, чем генерируется поле: initialize_mines
+        # берет заготовленное поле, и игра не зависит от скорости фонового потока
+        game.prefetched_board.result()
+
+        cell = first_move
+        while not game.game_win_over_label.text():
+            with recorder.measure("on_button_click"):
+                game.on_button_click(*cell)
+            if game.game_win_over_label.text():
+                break
+            # решатель нужен только игроку scripted, его обновление в ход не входит
+            cell = choose_cell(game.board, game.get_solver() if player == "scripted" else None, player, rng)
+
+        for _ in range(min(1000, game.board.cells_count)):
+            row, col = rng.randrange(field_size), rng.randrange(field_size)
+            with recorder.measure("count_adjacent_mines"):
+                game.count_adjacent_mines(row, col)
+
+    result = run_games(create, play, recorder, games, seed)
+    for game in created:
+        game.deleteLater()
+    return result
+
+
+def run_games(create, play, recorder: Recorder, games: int, seed: int) -> dict:
+    """
+    Создает игру (create) и прогоняет на ней игры (play), считает игры в секунду
+    и память, которую занимают создание игры и одна игра
+    """
+    state = create()
+    start = time.perf_counter()
+    for game_seed in range(seed, seed + games):
+        play(state, game_seed)
+    elapsed = time.perf_counter() - start
+
+    # память замеряется отдельной игрой вместе с созданием окна: tracemalloc
+    # замедляет код. tracemalloc видит только объекты Python, поэтому память
+    # Qt (виджеты, кнопки, картинки) видна лишь по приросту памяти процесса
+    samples = {operation: values[:] for operation, values in recorder.samples.items()}
+    gc.collect()
+    rss_before = current_rss()
+    tracemalloc.start()
+    state = create()
+    play(state, seed + games)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = current_rss()
+    recorder.samples = defaultdict(list, samples)
+
+    return {
+        "games": games,
+        "games_per_second": games / elapsed if elapsed else None,
+        "peak_memory_bytes": peak,
+        "rss_growth_bytes": rss_after - rss_before if rss_before is not None else None,
+        "max_rss_bytes": max_rss(),
+        "operations": recorder.summary()
+    }
+
+
+def current_rss() -> int | None:
+    """
+    Возвращает текущий объем памяти процесса (RSS) в байтах: через psutil, если он
+    установлен, иначе через /proc (Linux). Если узнать нельзя, возвращает None
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def max_rss() -> int | None:
+    """
+    Возвращает максимальный за время работы объем памяти процесса в байтах
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024   # в Linux - в килобайтах
+    if psutil is not None:
+        return getattr(psutil.Process().memory_info(), "peak_wset", None)   # Windows
+    return None
+
+
+# ---------------------------------------------------------------
+
+def run_storage_benchmark(rows: int, seed: int, with_qt: bool) -> dict:
+    """
+    Замеряет запись результатов и запросы к таблице лидеров на базе
+    со сгенерированными rows записями
+    """
+    recorder = Recorder()
+    rng = random.Random(seed)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "storage.sqlite")
+
+    try:
+        with recorder.measure("open_storage"):
+            storage = Storage(path)
+
+        batch = 10000
+        for start in range(0, rows, batch):
+            results = [
+                (f"player_{i}", rng.randint(1, 3600), rng.choice(["Beginner", "Professional"]))
+                for i in range(start, min(rows, start + batch))
+            ]
+            with recorder.measure("record_results_batch"):
+                storage.record_results(results)
+
+        for _ in range(200):
+            with recorder.measure("record_result"):
+                storage.record_result("single", rng.randint(1, 3600), "Beginner")
+
+        for _ in range(200):
+            with recorder.measure("load_leaders_first_page"):
+                storage.load_leaders_page("Beginner", None, 100)
+
+        after = None
+        for _ in range(min(200, rows // 200 + 1)):
+            with recorder.measure("load_leaders_next_page"):
+                page = storage.load_leaders_page("Beginner", after, 100)
+            if not page:
+                break
+            after = page[-1][:2]
+
+        for _ in range(3):
+            with recorder.measure("load_leaders_full"):
+                storage.load_leaders("Beginner")
+
+        storage.close()
+
+        if with_qt:
+            run_leaderboard_model(path, recorder)
+
+        return {"rows": rows, "operations": recorder.summary()}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def run_leaderboard_model(path: str, recorder: Recorder) -> None:
+    """
+    Замеряет время до появления первой страницы в модели таблицы лидеров
+    """
+    from backend.modules.leaderboard_model import LeaderboardModel
+    from PyQt6.QtCore import QEventLoop
+
+    model = LeaderboardModel(path)
+    for _ in range(50):
+        loop = QEventLoop()
+        model.page_loaded.connect(loop.quit)
+        with recorder.measure("leaderboard_model_first_page"):
+            model.set_field_size("Beginner")
+            loop.exec()
+        model.page_loaded.disconnect(loop.quit)
+
+
+def run_achievements_benchmark(increments: int) -> dict:
+    """
+    Замеряет изменение достижений в памяти и их запись на диск
+    на копии achievements.csv
+    """
+    config = load_config()
+    recorder = Recorder()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "achievements.csv")
+    shutil.copy(config.backend.data.achievements, path)
+
+    try:
+        with recorder.measure("load_achievements"):
+            store = AchievementsStore(path)
+
+        name = config.backend.achievements.texts.count_marked_mines_text
+        for _ in range(increments):
+            with recorder.measure("increment"):
+                store.increment(name)
+
+        for _ in range(200):
+            store.increment(name)
+            with recorder.measure("flush"):
+                store.flush()
+
+        return {"increments": increments, "operations": recorder.summary()}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# ---------------------------------------------------------------
+
+def parse_sizes(values: list[str]) -> list[tuple[str, int, int]]:
+    """
+    Переводит размеры вида "100:1500" (сторона поля и количество мин)
+    в список (название, размер, мины)
+    """
+    sizes = []
+    for value in values:
+        field_size, count_mines = map(int, value.split(":"))
+        sizes.append((f"Custom {field_size}x{field_size}", field_size, count_mines))
+    return sizes
+
+
+def git_commit() -> str | None:
+    """
+    Возвращает хэш текущего коммита (если бенчмарк запущен в git-репозитории)
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(arguments: list[str] | None = None) -> dict:
+    """
+    Разбирает аргументы, запускает все сценарии и выводит (или записывает) JSON
+    """
+    parser = argparse.ArgumentParser(description="Minesweeper headless benchmark")
+    parser.add_argument("--games", type=int, default=20, help="games per board size and player")
+    parser.add_argument("--sizes", nargs="*", default=["30:150", "100:1500"],
+                        help="custom boards as side:mines")
+    parser.add_argument("--players", nargs="*", default=["scripted", "random"], choices=["scripted", "random"])
+    parser.add_argument("--field-mode", default="painted", choices=["painted", "buttons"])
+    parser.add_argument("--rows", type=int, default=100000, help="generated leaderboard rows")
+    parser.add_argument("--increments", type=int, default=10000, help="achievement increments")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-qt", action="store_true", help="run games on Board without Qt")
+    parser.add_argument("--output", help="write JSON to this file instead of stdout")
+    options = parser.parse_args(arguments)
+
+    with_qt = not options.no_qt
+    if with_qt:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        try:
+            from PyQt6.QtWidgets import QApplication
+        except ImportError:
+            with_qt = False
+        else:
+            application = QApplication.instance() or QApplication(sys.argv[:1])
+
+    field_sizes = load_config().backend.game_parameters.field_sizes
+    sizes = [("Beginner", *field_sizes.beginner), ("Professional", *field_sizes.professional)]
+    sizes += parse_sizes(options.sizes)
+
+    games = []
+    for name, field_size, count_mines in sizes:
+        for player in options.players:
+            if with_qt:
+                result = run_qt_games(field_size, count_mines, player, options.games, options.seed,
+                                      options.field_mode)
+            else:
+                result = run_engine_games(field_size, count_mines, player, options.games, options.seed)
+            games.append({"board": name, "field_size": field_size, "count_mines": count_mines,
+                          "player": player, **result})
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": with_qt,
+            "field_mode": options.field_mode if with_qt else None,
+            "seed": options.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "games": games,
+        "storage": run_storage_benchmark(options.rows, options.seed, with_qt),
+        "achievements": run_achievements_benchmark(options.increments)
+    }
+
+    text = json.dumps(report, indent=4)
+    if options.output:
+        with open(options.output, "w", encoding="utf8") as file:
+            file.write(text)
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 
 # ---------------------------------------------------------------
@@ -55,6 +56,7 @@ class UiFiles:
 @dataclass
 class OtherFrontend:
     window_size: tuple[int, int]  
+    warm_up_chapters: bool
 
 
 @dataclass
@@ -134,6 +136,7 @@ class GameParameters:
     field_sizes: FieldSizes
     cell_parameters: CellParameters
     font_settings: FontSettings
+    field_mode: str
 
 
 @dataclass
@@ -151,7 +154,12 @@ class Config:
     backend: BackendConfig
 
 
+@lru_cache(maxsize=None)
 def load_config(path: str = 'data.json') -> Config:
+    """
+    Читает и разбирает data.json. Результат кэшируется: файл читается один раз
+    за запуск игры, а все разделы получают один и тот же объект конфига
+    """
     with open(path, 'r', encoding='utf8') as f:
         raw = json.load(f)
 
@@ -203,7 +211,8 @@ def load_config(path: str = 'data.json') -> Config:
                 settings=front['ui_files']['settings.ui']
             ),
             other_frontend=OtherFrontend(
-                window_size=(window_width, window_height)
+                window_size=(window_width, window_height),
+                warm_up_chapters=front['other']['warm_up_chapters'] == "On"
             )
         ),
         backend=BackendConfig(
@@ -248,7 +257,8 @@ def load_config(path: str = 'data.json') -> Config:
                 font_settings=FontSettings(
                     font_family=back['game_parameters']['font_settings']['font_family'],
                     font_size=int(back['game_parameters']['font_settings']['font_size'])
-                )
+                ),
+                field_mode=back['game_parameters']['field_mode']
             )
         )
     )
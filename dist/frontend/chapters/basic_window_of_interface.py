@@ -1,8 +1,10 @@
 from PyQt6.QtWidgets import QMainWindow, QPushButton
-from PyQt6.QtGui import QIcon, QBrush, QPixmap, QPalette
+from PyQt6.QtGui import QBrush, QPalette
 from PyQt6 import uic
 from PyQt6.QtCore import QSize
 
+from frontend.resources import get_icon, get_pixmap
+
 
 class BasicWindowInterface(QMainWindow):
     """
@@ -16,13 +18,13 @@ class BasicWindowInterface(QMainWindow):
         super().__init__()
 
         # 2. По переданным аргументам настраиваем окно: иконка, размер окна и дизайн
-        self.setWindowIcon(QIcon(logo_path))        # изменяем иконку окна приложения
+        self.setWindowIcon(get_icon(logo_path))        # изменяем иконку окна приложения
         self.setFixedSize(*window_size)     # изменяем размер окна и делаем его фиксированным
         uic.loadUi(ui_path, self)       # загружаем готовый дизайн
 
         # 3. Устанавливаем фоновую картинку окна
         palette = self.palette()        # получаем текущую палитру           
-        pixmap = QPixmap(background_path)       # создаем полотно с картинкой на фоне  
+        pixmap = get_pixmap(background_path)       # берем полотно с картинкой на фоне (из кэша)
         palette.setBrush(QPalette.ColorRole.Window, QBrush(pixmap))     # настраиваем кисть
         self.setPalette(palette)        # устанавливаем палитру
 
@@ -47,6 +49,6 @@ class BasicWindowInterface(QMainWindow):
         Метод отвечает за изменение иконок кнопок. Включает в себе подфункцию
         """
         for button, path in buttons.items():
-            button.setIcon(QIcon(path))     # установка иконки
+            button.setIcon(get_icon(path))     # установка иконки (картинка декодируется один раз)
             button.setIconSize(QSize(button.size()))      # изменение размеров иконки
             self.remove_strict_button_frames(button)    # удаление строгих границ кнопки 
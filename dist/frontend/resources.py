@@ -0,0 +1,30 @@
+from PyQt6.QtGui import QIcon, QPixmap
+
+
+# декодированные картинки в формате: {путь_до_картинки: QIcon}
+icons = {}
+
+# декодированные картинки в формате: {путь_до_картинки: QPixmap}
+pixmaps = {}
+
+
+def get_icon(path: str) -> QIcon:
+    """
+    Возвращает иконку для указанной картинки. Иконка общая для всех разделов:
+    картинка декодируется при первой отрисовке и дальше берется из иконки,
+    а не читается с диска заново. Вызывать только после создания QApplication
+    """
+    if path not in icons:
+        icons[path] = QIcon(path)
+    return icons[path]
+
+
+def get_pixmap(path: str) -> QPixmap:
+    """
+    Возвращает полотно с указанной картинкой. Картинка читается с диска
+    и декодируется один раз за запуск игры. Вызывать только после создания
+    QApplication
+    """
+    if path not in pixmaps:
+        pixmaps[path] = QPixmap(path)
+    return pixmaps[path]
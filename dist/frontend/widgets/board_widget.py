@@ -0,0 +1,202 @@
+from backend.modules.board import Board
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QMouseEvent, QPaintEvent, QImageReader
+from PyQt6.QtCore import Qt, QRect, QSize, pyqtSignal
+
+
+class BoardWidget(QWidget):
+    """
+    Реализует игровое поле в виде одного виджета, который сам рисует все клетки
+    в paintEvent. В отличие от сетки из QPushButton, количество объектов Qt не
+    зависит от размера поля: состояние клеток берется из Board, а картинки клеток
+    загружаются один раз. Перерисовывается только область изменившихся клеток.
+    Левый клик по клетке испускает сигнал cell_clicked, правый - cell_right_clicked
+    """
+
+    cell_clicked = pyqtSignal(int, int)
+    cell_right_clicked = pyqtSignal(int, int)
+
+    # кэш отмасштабированных картинок в формате: {(путь, ширина, высота): QPixmap}
+    pixmaps = {}
+
+    def __init__(self, parent: QWidget, board: Board, cell_size: tuple[int, int], shift: int,
+                 start_position: tuple[int, int], font: QFont, images: dict[str, str]):
+        super().__init__(parent)
+
+        self.board = board
+        self.cell_width, self.cell_height = cell_size   # габариты клетки
+        self.shift = shift  # интервал между левыми верхними углами соседних клеток
+        self.cell_font = font
+
+        # картинки клеток: закрытая клетка, клетка с флагом и мина
+        self.field_pixmap = self.load_pixmap(images['field'])
+        self.flag_pixmap = self.load_pixmap(images['flag'])
+        self.mine_pixmap = self.load_pixmap(images['mine'])
+
+        # клетки, на которых была нажата кнопка мыши, в формате: {кнопка_мыши: (ряд, столбец)}
+        self.pressed_cells = {}
+
+        # клетки, на которых показана мина (подсказка или проигрыш)
+        self.shown_mines = bytearray(board.cells_count)
+
+        # виджет занимает прямоугольник от левой верхней до правой нижней клетки
+        span = shift * (board.field_size - 1)
+        self.setGeometry(*start_position, span + self.cell_width, span + self.cell_height)
+
+
+    def load_pixmap(self, path: str) -> QPixmap:
+        """
+        Загружает картинку сразу в размере клетки (с сохранением пропорций), не
+        храня картинку в исходном размере. Результат кэшируется, поэтому каждая
+        картинка читается с диска один раз для каждого размера клетки
+        """
+        key = (path, self.cell_width, self.cell_height)
+        if key not in self.pixmaps:
+            reader = QImageReader(path)
+            reader.setScaledSize(reader.size().scaled(
+                QSize(self.cell_width, self.cell_height), Qt.AspectRatioMode.KeepAspectRatio
+            ))
+            self.pixmaps[key] = QPixmap.fromImage(reader.read())
+        return self.pixmaps[key]
+
+
+    def cell_rect(self, row: int, col: int) -> QRect:
+        """
+        Возвращает прямоугольник, который занимает клетка на виджете
+        """
+        return QRect(col * self.shift, row * self.shift, self.cell_width, self.cell_height)
+
+
+    def cell_at(self, x: int, y: int) -> tuple[int, int] | None:
+        """
+        Переводит координаты точки на виджете в координаты клетки. Если клетки
+        перекрываются, выбирается верхняя (нарисованная последней)
+        """
+        if x < 0 or y < 0:
+            return None
+
+        last = self.board.field_size - 1
+        row, col = min(y // self.shift, last), min(x // self.shift, last)
+
+        # между клетками может быть зазор, если shift больше размера клетки
+        if x - col * self.shift >= self.cell_width or y - row * self.shift >= self.cell_height:
+            return None
+        return row, col
+
+
+    def cells_range(self, rect: QRect) -> tuple[range, range]:
+        """
+        Возвращает диапазоны рядов и столбцов клеток, пересекающих прямоугольник
+        """
+        size = self.board.field_size
+
+        def axis_range(start: int, end: int, cell: int) -> range:
+            first = max(0, (start - cell) // self.shift + 1)
+            return range(first, min(size, end // self.shift + 1))
+
+        return (axis_range(rect.top(), rect.bottom(), self.cell_height),
+                axis_range(rect.left(), rect.right(), self.cell_width))
+
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Рисует клетки, попавшие в перерисовываемую область
+        """
+        painter = QPainter(self)
+        painter.setFont(self.cell_font)
+        painter.setPen(QColor("black") if self.isEnabled() else QColor("grey"))
+
+        board, size = self.board, self.board.field_size
+        rows, cols = self.cells_range(event.rect())
+
+        for row in rows:
+            for col in cols:
+                index = row * size + col
+                rect = self.cell_rect(row, col)
+
+                if self.shown_mines[index]:
+                    self.draw_pixmap(painter, rect, self.mine_pixmap)
+                elif board.revealed[index]:
+                    count = board.adjacent[index]
+                    if count:   # у пустой клетки текст не выводится
+                        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(count))
+                elif board.flags[index]:
+                    self.draw_pixmap(painter, rect, self.flag_pixmap)
+                else:
+                    self.draw_pixmap(painter, rect, self.field_pixmap)
+
+        painter.end()
+
+
+    @staticmethod
+    def draw_pixmap(painter: QPainter, rect: QRect, pixmap: QPixmap) -> None:
+        """
+        Рисует картинку по центру прямоугольника клетки
+        """
+        x = rect.x() + (rect.width() - pixmap.width()) // 2
+        y = rect.y() + (rect.height() - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
+
+
+    def event_cell(self, event: QMouseEvent) -> tuple[int, int] | None:
+        """
+        Возвращает клетку под курсором в момент события мыши
+        """
+        position = event.position().toPoint()
+        return self.cell_at(position.x(), position.y())
+
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """
+        Запоминает клетку, на которой была нажата кнопка мыши
+        """
+        self.pressed_cells[event.button()] = self.event_cell(event)
+
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """
+        Испускает сигнал, соответствующий кнопке мыши, только если кнопка была
+        нажата и отпущена на одной и той же клетке (как у QPushButton): нажатие
+        с последующим уводом курсора на другую клетку не считается кликом
+        """
+        cell = self.event_cell(event)
+        if cell is None or self.pressed_cells.pop(event.button(), None) != cell:
+            return
+
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.cell_clicked.emit(*cell)
+        elif event.button() == Qt.MouseButton.RightButton:
+            self.cell_right_clicked.emit(*cell)
+
+
+    def update_cells(self, cells: list[tuple[int, int]]) -> None:
+        """
+        Запрашивает перерисовку прямоугольника, охватывающего переданные клетки
+        """
+        if not cells:
+            return
+
+        rows = [row for row, _ in cells]
+        cols = [col for _, col in cells]
+        top_left = self.cell_rect(min(rows), min(cols))
+        bottom_right = self.cell_rect(max(rows), max(cols))
+        self.update(top_left.united(bottom_right))
+
+
+    def show_mines(self, positions: list[tuple[int, int]]) -> None:
+        """
+        Показывает мины в переданных клетках
+        """
+        for row, col in positions:
+            self.shown_mines[self.board.index(row, col)] = 1
+        self.update_cells(positions)
+
+
+    def reset(self) -> None:
+        """
+        Скрывает показанные мины, включает виджет и перерисовывает поле целиком
+        """
+        self.shown_mines = bytearray(self.board.cells_count)
+        self.setEnabled(True)
+        self.update()